@@ -9,8 +9,6 @@ import sys
 import subprocess
 import urllib.request
 import ssl
-import zipfile
-import tempfile
 from pathlib import Path
 
 MODELS_DIR = Path.home() / ".ufps" / "models"
@@ -38,6 +36,22 @@ def download_with_gdown():
         print(f"gdown failed: {e}")
         return None
 
+def download_direct():
+    """Try a direct, resumable download over a pooled HTTPS connection"""
+    print("Attempting to download models directly...")
+    
+    from install import fetch_url
+    
+    file_id = "1APIzVeI-4ZZCEuIRE1m6WYfSCaOsi_7_"
+    output = MODELS_DIR / "models.zip"
+    
+    try:
+        fetch_url(f"https://drive.google.com/uc?export=download&id={file_id}", output)
+        return output
+    except Exception as e:
+        print(f"Direct download failed: {e}")
+        return None
+
 def download_with_wget():
     """Try downloading with wget"""
     print("Attempting to download models using wget...")
@@ -67,28 +81,16 @@ def extract_models(zip_path):
     """Extract model files from zip"""
     print("Extracting models...")
     
+    from install import extract_pkl_files
+    
     try:
-        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            # Extract to temp directory first
-            with tempfile.TemporaryDirectory() as temp_dir:
-                zip_ref.extractall(temp_dir)
-                
-                # Find and copy .pkl files
-                temp_path = Path(temp_dir)
-                pkl_files = list(temp_path.rglob("*.pkl"))
-                
-                if not pkl_files:
-                    print("No .pkl files found in archive")
-                    return False
-                
-                for pkl_file in pkl_files:
-                    dest = MODELS_DIR / pkl_file.name
-                    print(f"Copying {pkl_file.name} to {dest}")
-                    pkl_file.rename(dest)
-                
-                print(f"Extracted {len(pkl_files)} model files")
-                return True
-                
+        count = extract_pkl_files(zip_path, MODELS_DIR)
+        if not count:
+            print("No .pkl files found in archive")
+            return False
+        
+        print(f"Extracted {count} model files to {MODELS_DIR}")
+        return True
     except Exception as e:
         print(f"Extraction failed: {e}")
         return False
@@ -101,9 +103,11 @@ def main():
     # Create models directory
     MODELS_DIR.mkdir(parents=True, exist_ok=True)
     
-    # Check if models already exist
-    existing_models = list(MODELS_DIR.glob("*.pkl"))
-    if len(existing_models) >= 3:
+    # Check if models already exist and match the pinned checksums
+    from install import verify_models
+    
+    if verify_models(MODELS_DIR):
+        existing_models = list(MODELS_DIR.glob("*.pkl"))
         print(f"Models already present: {[m.name for m in existing_models]}")
         return 0
     
@@ -113,11 +117,15 @@ def main():
     # Method 1: gdown (best for Google Drive)
     zip_path = download_with_gdown()
     
-    # Method 2: wget
+    # Method 2: direct download (resumes partial zips)
+    if not zip_path or not zip_path.exists():
+        zip_path = download_direct()
+    
+    # Method 3: wget
     if not zip_path or not zip_path.exists():
         zip_path = download_with_wget()
     
-    # Method 3: Manual download instructions
+    # Method 4: Manual download instructions
     if not zip_path or not zip_path.exists():
         print("\n" + "=" * 40)
         print("Automatic download failed. Please download manually:")
@@ -127,8 +135,8 @@ def main():
         print("=" * 40)
         return 1
     
-    # Extract models
-    if extract_models(zip_path):
+    # Extract models; the manifest pins the checkpoints, not the archive
+    if extract_models(zip_path) and verify_models(MODELS_DIR):
         print("\nModels downloaded successfully!")
         zip_path.unlink()  # Clean up zip file
         return 0
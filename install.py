@@ -11,41 +11,95 @@ import platform
 import shutil
 import tempfile
 import urllib.request
+import urllib.error
 import ssl
 import zipfile
 import tarfile
 from pathlib import Path
 import json
+import asyncio
 import hashlib
+import io
+import struct
+import threading
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import urllib3
+except ImportError:
+    # Stock interpreters don't ship urllib3; fall back to urllib.request
+    urllib3 = None
+
+try:
+    import certifi
+except ImportError:
+    certifi = None
+
+try:
+    import rapidgzip
+except ImportError:
+    # Optional: multi-threaded inflate for the model archive
+    rapidgzip = None
 
 # Installation configuration
+INSTALLER_VERSION = "1.0.0"
 INSTALL_DIR = Path.home() / ".ufps"
 VENV_DIR = INSTALL_DIR / "venv"
 RIFE_DIR = INSTALL_DIR / "RIFE"
 MODELS_DIR = INSTALL_DIR / "models"
 FFMPEG_DIR = INSTALL_DIR / "ffmpeg"
 CONFIG_FILE = INSTALL_DIR / "config.json"
+MODELS_MANIFEST = Path(__file__).parent / "models" / "models.sha256"
 BIN_DIR = Path.home() / ".local" / "bin"
 
 # URLs for dependencies
 RIFE_REPO = "https://github.com/hzwer/ECCV2022-RIFE.git"
+RIFE_TARBALL_URL = "https://codeload.github.com/hzwer/ECCV2022-RIFE/tar.gz/refs/heads/main"
 MODEL_URLS = {
     "RIFE_HD": {
         # Google Drive direct download link (using export format)
         "url": "https://drive.google.com/uc?export=download&id=1APIzVeI-4ZZCEuIRE1m6WYfSCaOsi_7_",
         "size": "~50MB",
         "files": ["flownet.pkl", "contextnet.pkl", "unet.pkl", "fusionnet.pkl"],
-        "gdrive_id": "1APIzVeI-4ZZCEuIRE1m6WYfSCaOsi_7_"
+        "gdrive_id": "1APIzVeI-4ZZCEuIRE1m6WYfSCaOsi_7_",
+        "subdir": ""  # Default set, installed directly into MODELS_DIR
     },
     "RIFE_v4": {
         # Alternative model from the paper
         "url": "https://drive.google.com/uc?export=download&id=1h42aGYPNJn2q8j_GVkS_yDu__G_UZ2GX",
         "size": "~13MB", 
         "files": ["flownet.pkl", "contextnet.pkl", "unet.pkl"],
-        "gdrive_id": "1h42aGYPNJn2q8j_GVkS_yDu__G_UZ2GX"
+        "gdrive_id": "1h42aGYPNJn2q8j_GVkS_yDu__G_UZ2GX",
+        "subdir": "RIFE_v4"
     }
 }
 
+# Host facts, probed once for the lifetime of the installer
+SYS = types.SimpleNamespace(
+    system=platform.system().lower(),
+    arch=platform.machine().lower(),
+    has_brew=bool(shutil.which("brew")),
+    has_apt=bool(shutil.which("apt-get")),
+    has_git=bool(shutil.which("git")),
+    has_ffmpeg=bool(shutil.which("ffmpeg"))
+)
+
+# Streaming download settings
+CHUNK_SIZE = 1 << 20
+PROGRESS_INTERVAL = 0.05  # Redraw progress bars at most 20 times a second
+
+if urllib3:
+    _pool = urllib3.PoolManager(
+        maxsize=4,
+        retries=urllib3.Retry(total=5, backoff_factor=0.5, status_forcelist=[502, 503, 504]),
+        cert_reqs="CERT_REQUIRED",
+        ca_certs=certifi.where() if certifi else None
+    )
+else:
+    _pool = None
+
 # FFmpeg download URLs by platform
 FFMPEG_URLS = {
     "darwin": {
@@ -68,26 +122,34 @@ class ColorPrint:
     ENDC = '\033[0m'
     BOLD = '\033[1m'
     
+    # Steps run concurrently; keep each message on its own line
+    lock = threading.Lock()
+    
     @classmethod
     def info(cls, msg):
-        print(f"{cls.OKBLUE}ℹ{cls.ENDC}  {msg}")
+        with cls.lock:
+            print(f"{cls.OKBLUE}ℹ{cls.ENDC}  {msg}")
     
     @classmethod
     def success(cls, msg):
-        print(f"{cls.OKGREEN}✓{cls.ENDC}  {msg}")
+        with cls.lock:
+            print(f"{cls.OKGREEN}✓{cls.ENDC}  {msg}")
     
     @classmethod
     def warning(cls, msg):
-        print(f"{cls.WARNING}⚠{cls.ENDC}  {msg}")
+        with cls.lock:
+            print(f"{cls.WARNING}⚠{cls.ENDC}  {msg}")
     
     @classmethod
     def error(cls, msg):
-        print(f"{cls.FAIL}✗{cls.ENDC}  {msg}")
+        with cls.lock:
+            print(f"{cls.FAIL}✗{cls.ENDC}  {msg}")
     
     @classmethod
     def header(cls, msg):
-        print(f"\n{cls.HEADER}{cls.BOLD}{msg}{cls.ENDC}")
-        print("=" * len(msg))
+        with cls.lock:
+            print(f"\n{cls.HEADER}{cls.BOLD}{msg}{cls.ENDC}")
+            print("=" * len(msg))
 
 def check_python_version():
     """Ensure Python 3.8+"""
@@ -98,29 +160,104 @@ def check_python_version():
 
 def check_system():
     """Check system compatibility"""
-    system = platform.system().lower()
-    arch = platform.machine().lower()
-    
-    if system not in ["darwin", "linux"]:
-        ColorPrint.error(f"Unsupported OS: {system}")
+    if SYS.system not in ["darwin", "linux"]:
+        ColorPrint.error(f"Unsupported OS: {SYS.system}")
         ColorPrint.info("UFPS currently supports macOS and Linux")
         sys.exit(1)
     
-    return system, arch
+    return SYS.system, SYS.arch
 
-def run_command(cmd, cwd=None, capture=False):
-    """Run a shell command"""
+def run_command(cmd, cwd=None, capture=False, env=None):
+    """Run a command given as an argv list (no intermediate shell)"""
+    cmd = [str(arg) for arg in cmd]
     try:
         if capture:
-            result = subprocess.run(cmd, shell=True, cwd=cwd, capture_output=True, text=True)
+            result = subprocess.run(cmd, cwd=cwd, env=env, capture_output=True, text=True)
             return result.returncode == 0, result.stdout, result.stderr
         else:
-            result = subprocess.run(cmd, shell=True, cwd=cwd)
+            result = subprocess.run(cmd, cwd=cwd, env=env)
             return result.returncode == 0
     except Exception as e:
         ColorPrint.error(f"Command failed: {e}")
         return False if not capture else (False, "", str(e))
 
+def http_get(url, headers=None):
+    """Open a streaming GET request, reusing pooled connections when available"""
+    if _pool is not None:
+        return _pool.request("GET", url, headers=headers, preload_content=False)
+    
+    context = None
+    if "drive.google.com" in url:
+        # Some stock Python builds lack a CA bundle; relax verification for
+        # this one Google Drive request only
+        context = ssl.create_default_context()
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    try:
+        return urllib.request.urlopen(urllib.request.Request(url, headers=headers or {}), context=context)
+    except urllib.error.HTTPError as e:
+        # Let callers inspect error statuses (e.g. 416) like urllib3 does
+        return e
+
+def print_progress(downloaded, total_size):
+    """Draw a single-line download progress bar"""
+    if total_size > 0:
+        percent = min(100, downloaded * 100 // total_size)
+        bar_length = 40
+        filled = int(bar_length * percent // 100)
+        bar = '█' * filled + '░' * (bar_length - filled)
+        size_mb = total_size / 1024 / 1024
+        downloaded_mb = downloaded / 1024 / 1024
+        line = f'\r  [{bar}] {percent}% ({downloaded_mb:.1f}/{size_mb:.1f} MB)'
+    else:
+        line = f'\r  Downloading... {downloaded / 1024 / 1024:.1f} MB'
+    with ColorPrint.lock:
+        sys.stdout.write(line)
+        sys.stdout.flush()
+
+def fetch_url(url, dest):
+    """Stream url into dest, resuming a partial download with a Range request"""
+    dest = Path(dest)
+    offset = dest.stat().st_size if dest.exists() else 0
+    headers = {"Range": f"bytes={offset}-"} if offset else {}
+    
+    resp = http_get(url, headers)
+    try:
+        if resp.status == 416:
+            # Nothing left to fetch - the partial file is already complete
+            return True
+        if resp.status >= 400:
+            raise RuntimeError(f"HTTP {resp.status} for {url}")
+        
+        if resp.status == 206:
+            mode = "ab"
+        else:
+            # Server ignored the Range header, start over
+            mode = "wb"
+            offset = 0
+        
+        total_size = int(resp.headers.get("Content-Length") or 0)
+        if total_size:
+            total_size += offset
+        
+        downloaded = offset
+        last_draw = 0.0
+        with open(dest, mode, buffering=CHUNK_SIZE) as f:
+            for chunk in iter(lambda: resp.read(CHUNK_SIZE), b""):
+                f.write(chunk)
+                downloaded += len(chunk)
+                now = time.monotonic()
+                if now - last_draw >= PROGRESS_INTERVAL:
+                    last_draw = now
+                    print_progress(downloaded, total_size)
+        print_progress(downloaded, total_size)
+        with ColorPrint.lock:
+            print()  # New line after progress
+        return True
+    finally:
+        # Hand the socket back to the pool for the next download
+        getattr(resp, "release_conn", resp.close)()
+
 def download_file(url, dest, desc="Downloading"):
     """Download file with progress"""
     try:
@@ -134,45 +271,27 @@ def download_file(url, dest, desc="Downloading"):
                 gdown.download(url, str(dest), quiet=False)
                 return True
             except ImportError:
-                # Fall back to wget/curl for Google Drive
+                # Fall back to a direct download, then wget/curl for Google Drive
                 ColorPrint.warning("gdown not available, trying alternative download method...")
                 gdrive_id = url.split("id=")[-1] if "id=" in url else None
                 if gdrive_id:
+                    direct_url = f"https://drive.google.com/uc?export=download&id={gdrive_id}"
+                    try:
+                        if fetch_url(direct_url, dest):
+                            return True
+                    except Exception as e:
+                        ColorPrint.warning(f"Direct download failed: {e}")
                     # Try wget with Google Drive
-                    wget_cmd = f'wget --no-check-certificate "https://drive.google.com/uc?export=download&id={gdrive_id}" -O "{dest}"'
+                    wget_cmd = ["wget", "--no-check-certificate", direct_url, "-O", dest]
                     success = run_command(wget_cmd)
                     if success:
                         return True
                     # Try curl as fallback
-                    curl_cmd = f'curl -L "https://drive.google.com/uc?export=download&id={gdrive_id}" -o "{dest}"'
+                    curl_cmd = ["curl", "-L", direct_url, "-o", dest]
                     success = run_command(curl_cmd)
                     return success
         
-        # Standard download for non-Google Drive URLs
-        def download_hook(block_num, block_size, total_size):
-            downloaded = block_num * block_size
-            percent = min(100, downloaded * 100 // total_size) if total_size > 0 else 0
-            bar_length = 40
-            filled = int(bar_length * percent // 100)
-            bar = '█' * filled + '░' * (bar_length - filled)
-            if total_size > 0:
-                size_mb = total_size / 1024 / 1024
-                downloaded_mb = downloaded / 1024 / 1024
-                print(f'\r  [{bar}] {percent}% ({downloaded_mb:.1f}/{size_mb:.1f} MB)', end='', flush=True)
-            else:
-                print(f'\r  Downloading... {downloaded / 1024 / 1024:.1f} MB', end='', flush=True)
-        
-        # Create SSL context that doesn't verify certificates (for Google Drive)
-        if "drive.google.com" in url:
-            ssl_context = ssl.create_default_context()
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
-            opener = urllib.request.build_opener(urllib.request.HTTPSHandler(context=ssl_context))
-            urllib.request.install_opener(opener)
-        
-        urllib.request.urlretrieve(url, dest, reporthook=download_hook)
-        print()  # New line after progress
-        return True
+        return fetch_url(url, dest)
     except Exception as e:
         ColorPrint.error(f"Download failed: {e}")
         return False
@@ -186,14 +305,14 @@ def setup_virtual_environment():
         return True
     
     ColorPrint.info("Creating virtual environment...")
-    if not run_command(f'"{sys.executable}" -m venv "{VENV_DIR}"'):
+    if not run_command([sys.executable, "-m", "venv", VENV_DIR]):
         ColorPrint.error("Failed to create virtual environment")
         return False
     
     ColorPrint.success("Virtual environment created")
     
     # Get pip path in venv
-    if platform.system() == "Windows":
+    if SYS.system == "windows":
         pip_path = VENV_DIR / "Scripts" / "pip"
         python_path = VENV_DIR / "Scripts" / "python"
     else:
@@ -202,7 +321,7 @@ def setup_virtual_environment():
     
     # Upgrade pip
     ColorPrint.info("Upgrading pip...")
-    run_command(f'"{python_path}" -m pip install --upgrade pip')
+    run_command([python_path, "-m", "pip", "install", "--upgrade", "pip"])
     
     return True
 
@@ -210,13 +329,15 @@ def install_python_packages():
     """Install Python dependencies in venv"""
     ColorPrint.header("Installing Python packages")
     
-    if platform.system() == "Windows":
+    if SYS.system == "windows":
         pip_path = VENV_DIR / "Scripts" / "pip"
     else:
         pip_path = VENV_DIR / "bin" / "pip"
     
+    # PyTorch comes from the CPU wheel index, everything else from PyPI
+    torch_index = "https://download.pytorch.org/whl/cpu"
+    torch_packages = ["torch", "torchvision"]
     packages = [
-        "torch torchvision --index-url https://download.pytorch.org/whl/cpu",
         "opencv-python",
         "numpy",
         "Pillow",
@@ -228,14 +349,101 @@ def install_python_packages():
         "scikit-video"  # Required by RIFE's inference_video.py
     ]
     
-    for package in packages:
-        ColorPrint.info(f"Installing {package.split()[0]}...")
-        if not run_command(f'"{pip_path}" install {package}'):
-            ColorPrint.warning(f"Failed to install {package}, continuing...")
+    # Skip pip's startup version check, never block on a prompt, and keep
+    # downloaded wheels inside INSTALL_DIR so reinstalls reuse them
+    env = {
+        **os.environ,
+        "PIP_DISABLE_PIP_VERSION_CHECK": "1",
+        "PIP_NO_INPUT": "1",
+        "PIP_CACHE_DIR": str(INSTALL_DIR / ".pipcache")
+    }
+    
+    # pip merges candidates from every index it is given and takes the highest
+    # version, so a shared run could pull a newer CUDA torch from PyPI (or
+    # other packages from the torch index). Torch gets its own run with only
+    # the CPU index; everything else resolves from PyPI in one batch.
+    requirements = INSTALL_DIR / "requirements.txt"
+    requirements.write_text("\n".join(packages) + "\n")
+    
+    # Bytecode is compiled later by precompile_venv using every core,
+    # instead of serially per package by pip
+    pip_install = [pip_path, "install", "--no-compile", "--prefer-binary"]
+    
+    batches = [
+        ("PyTorch", torch_packages + ["--index-url", torch_index], [[p] for p in torch_packages]),
+        (f"{len(packages)} packages", ["-r", requirements], [[p] for p in packages]),
+    ]
+    failed = []
+    for label, args, singles in batches:
+        ColorPrint.info(f"Installing {label}...")
+        if run_command(pip_install + args, env=env):
+            continue
+        # Fall back to one package at a time so a single failure doesn't block the rest
+        ColorPrint.warning("Batch install failed, installing packages individually...")
+        index = args[-2:] if "--index-url" in args else []
+        for package in singles:
+            ColorPrint.info(f"Installing {package[0]}...")
+            if not run_command(pip_install + package + index, env=env):
+                ColorPrint.warning(f"Failed to install {package[0]}, continuing...")
+                failed.append(package[0])
+    
+    if failed:
+        ColorPrint.error(f"Failed to install: {', '.join(failed)}")
+        return False
     
     ColorPrint.success("Python packages installed")
     return True
 
+def extract_member(tf, member, dest):
+    """Extract one tar member, using the safe "data" filter where tarfile has it"""
+    if hasattr(tarfile, "data_filter"):
+        # Python 3.12+ warns (and 3.14 changes the default) without an explicit filter
+        tf.extract(member, dest, filter="data")
+    else:
+        tf.extract(member, dest)
+
+def download_rife_tarball():
+    """Stream the RIFE source tarball into RIFE_DIR without any git metadata"""
+    tmp_dir = Path(tempfile.mkdtemp(prefix="rife_", dir=RIFE_DIR.parent))
+    resp = None
+    try:
+        resp = http_get(RIFE_TARBALL_URL)
+        if resp.status >= 400:
+            raise RuntimeError(f"HTTP {resp.status} for {RIFE_TARBALL_URL}")
+        with tarfile.open(fileobj=resp, mode="r|gz") as tf:
+            for member in tf:
+                # Strip the leading "ECCV2022-RIFE-main/" component
+                parts = Path(member.name).parts[1:]
+                if not parts or ".." in parts or member.issym() or member.islnk():
+                    continue
+                member.name = str(Path(*parts))
+                extract_member(tf, member, tmp_dir)
+        tmp_dir.rename(RIFE_DIR)
+        return True
+    except Exception as e:
+        ColorPrint.warning(f"RIFE tarball download failed: {e}")
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        return False
+    finally:
+        if resp is not None:
+            getattr(resp, "release_conn", resp.close)()
+
+def precompile_venv():
+    """Compile the venv's bytecode up front so the first ufps run starts fast"""
+    ColorPrint.header("Precompiling bytecode")
+    
+    if SYS.system == "windows":
+        python_path = VENV_DIR / "Scripts" / "python"
+    else:
+        python_path = VENV_DIR / "bin" / "python"
+    
+    # -j 0 uses every core; failures only cost startup time, so don't fail the install
+    if not run_command([python_path, "-m", "compileall", "-j", "0", "-q", VENV_DIR / "lib"]):
+        ColorPrint.warning("Some modules could not be precompiled")
+    
+    ColorPrint.success("Bytecode precompiled")
+    return True
+
 def setup_rife():
     """Download and setup RIFE"""
     ColorPrint.header("Setting up RIFE")
@@ -244,8 +452,14 @@ def setup_rife():
         ColorPrint.info("RIFE already exists")
         return True
     
+    if not (SYS.has_git and os.environ.get("UFPS_USE_GIT")):
+        ColorPrint.info("Downloading RIFE source...")
+        if download_rife_tarball():
+            ColorPrint.success("RIFE downloaded")
+            return True
+    
     ColorPrint.info("Cloning RIFE repository...")
-    if not run_command(f'git clone --depth 1 "{RIFE_REPO}" "{RIFE_DIR}"'):
+    if not run_command(["git", "clone", "--depth", "1", RIFE_REPO, RIFE_DIR]):
         ColorPrint.error("Failed to clone RIFE. Is git installed?")
         ColorPrint.info("Install git with: brew install git (macOS) or apt-get install git (Linux)")
         return False
@@ -253,15 +467,129 @@ def setup_rife():
     ColorPrint.success("RIFE downloaded")
     return True
 
+def fast_copy(src, dst):
+    """Copy a file in-kernel, letting reflink-capable filesystems share extents"""
+    if not hasattr(os, "copy_file_range"):
+        # macOS: shutil already uses fcopyfile (clonefile on APFS)
+        return shutil.copy2(src, dst)
+    try:
+        with open(src, "rb") as s, open(dst, "wb") as d:
+            remaining = os.fstat(s.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(s.fileno(), d.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+    except OSError:
+        # e.g. EXDEV on older kernels, or filesystems without support
+        return shutil.copy2(src, dst)
+    shutil.copystat(src, dst)
+    return dst
+
+def _open_member(zip_ref, raw, info):
+    """Open a zip member, inflating deflate data on all cores when rapidgzip is available"""
+    if rapidgzip is None or info.compress_type != zipfile.ZIP_DEFLATED:
+        return zip_ref.open(info)
+    
+    # Skip the local file header to reach the raw deflate stream
+    raw.seek(info.header_offset)
+    name_len, extra_len = struct.unpack("<HH", raw.read(30)[26:30])
+    raw.seek(info.header_offset + 30 + name_len + extra_len)
+    member = io.BytesIO(raw.read(info.compress_size))
+    return rapidgzip.open(member, parallelization=os.cpu_count())
+
+def extract_pkl_files(zip_path, dest_dir):
+    """Extract the .pkl checkpoints from a model archive into dest_dir"""
+    count = 0
+    with zipfile.ZipFile(zip_path, 'r') as zip_ref, open(zip_path, 'rb') as raw:
+        for info in zip_ref.infolist():
+            name = Path(info.filename).name
+            if not name.endswith(".pkl"):
+                continue
+            # Stream straight into place - no temporary copy on disk
+            with _open_member(zip_ref, raw, info) as src, open(dest_dir / name, "wb", buffering=CHUNK_SIZE) as dst:
+                if hasattr(os, "posix_fallocate") and info.file_size:
+                    os.posix_fallocate(dst.fileno(), 0, info.file_size)
+                shutil.copyfileobj(src, dst, CHUNK_SIZE)
+            count += 1
+    return count
+
+def _fetch_one(item):
+    """Download and extract one MODEL_URLS entry into its own directory"""
+    name, spec = item
+    dest_dir = MODELS_DIR / spec["subdir"]
+    dest_dir.mkdir(parents=True, exist_ok=True)
+    zip_path = dest_dir / f"{name}.zip"
+    
+    if not download_file(spec["url"], zip_path, f"Downloading {name} models ({spec['size']})"):
+        return False
+    try:
+        count = extract_pkl_files(zip_path, dest_dir)
+    except zipfile.BadZipFile:
+        ColorPrint.error(f"{name} download is not a valid zip archive")
+        return False
+    finally:
+        zip_path.unlink(missing_ok=True)
+    
+    if not count:
+        ColorPrint.error(f"No .pkl files found in {name} archive")
+        return False
+    ColorPrint.success(f"Extracted {count} {name} model files")
+    return True
+
+def sha256_file(path):
+    """Hex SHA-256 digest of a file, read in large chunks"""
+    # 1 MiB unbuffered reads into one reused buffer keep OpenSSL's
+    # SHA-NI / ARMv8 block loop busy without copying or peak RAM
+    h = hashlib.sha256()
+    buf = bytearray(CHUNK_SIZE)
+    view = memoryview(buf)
+    with open(path, "rb", buffering=0) as f:
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            h.update(view[:n])
+    return h.hexdigest()
+
+def load_manifest():
+    """Read the pinned {filename: sha256} checkpoint manifest"""
+    if not MODELS_MANIFEST.exists():
+        return {}
+    expected = {}
+    for line in MODELS_MANIFEST.read_text().splitlines():
+        if line.strip():
+            digest, name = line.split(maxsplit=1)
+            expected[name.lstrip("*")] = digest
+    return expected
+
+def verify_models(models_dir=MODELS_DIR):
+    """Check installed checkpoints against the manifest, deleting mismatches"""
+    expected = load_manifest()
+    if not expected:
+        # No manifest to compare against - presence is all we can check
+        return any(models_dir.glob("*.pkl"))
+    
+    ok = True
+    for name, digest in expected.items():
+        path = models_dir / name
+        if not path.exists():
+            ok = False
+        elif sha256_file(path) != digest:
+            ColorPrint.warning(f"{name} is corrupt, removing it")
+            path.unlink()
+            ok = False
+    return ok
+
 def download_models():
     """Install RIFE models from bundled files or download"""
     ColorPrint.header("Installing AI models")
     
     MODELS_DIR.mkdir(parents=True, exist_ok=True)
     
-    # Check if models already exist
-    existing_models = list(MODELS_DIR.glob("*.pkl"))
-    if existing_models:
+    # Skip only when every checkpoint is present and intact
+    if verify_models():
+        existing_models = list(MODELS_DIR.glob("*.pkl"))
         ColorPrint.info(f"Models already installed: {[m.name for m in existing_models]}")
         return True
     
@@ -276,12 +604,17 @@ def download_models():
             for model_file in bundled_files:
                 dest = MODELS_DIR / model_file.name
                 ColorPrint.info(f"  Copying {model_file.name}")
-                shutil.copy2(model_file, dest)
+                fast_copy(model_file, dest)
             ColorPrint.success(f"Installed {len(bundled_files)} model files")
             return True
     
+    # Only the default set is loaded; the others stay available for manual use
+    ColorPrint.warning("No bundled models found, downloading...")
+    if _fetch_one(("RIFE_HD", MODEL_URLS["RIFE_HD"])):
+        ColorPrint.success("Models downloaded")
+        return True
+    
     # Fallback to download instructions
-    ColorPrint.warning("No bundled models found")
     ColorPrint.info("Models can be downloaded manually:")
     ColorPrint.info("1. Download HD models from: https://drive.google.com/file/d/1APIzVeI-4ZZCEuIRE1m6WYfSCaOsi_7_/view")
     ColorPrint.info("2. Extract the .pkl files to: ~/.ufps/models/")
@@ -289,12 +622,69 @@ def download_models():
     # Don't fail installation - models can be obtained later
     return True
 
+def _pump(src, dst):
+    """Copy a response stream into a subprocess pipe, then close the pipe"""
+    try:
+        for chunk in iter(lambda: src.read(CHUNK_SIZE), b""):
+            dst.write(chunk)
+    except OSError:
+        pass  # Reader went away, e.g. extraction failed
+    finally:
+        try:
+            dst.close()
+        except OSError:
+            pass
+
+def download_ffmpeg_tarball(url):
+    """Stream a static ffmpeg .tar.xz, keeping only the ffmpeg and ffprobe binaries"""
+    ColorPrint.info("Downloading static FFmpeg build...")
+    resp = xz = feeder = None
+    try:
+        resp = http_get(url)
+        if resp.status >= 400:
+            raise RuntimeError(f"HTTP {resp.status} for {url}")
+        
+        if shutil.which("xz"):
+            # Let xz decode on all cores while tarfile parses its output
+            xz = subprocess.Popen(["xz", "-T0", "-d", "-c"], stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+            feeder = threading.Thread(target=_pump, args=(resp, xz.stdin), daemon=True)
+            feeder.start()
+            tf = tarfile.open(fileobj=xz.stdout, mode="r|")
+        else:
+            tf = tarfile.open(fileobj=resp, mode="r|xz")
+        
+        found = set()
+        with tf:
+            for member in tf:
+                name = Path(member.name).name
+                if member.isfile() and name in ("ffmpeg", "ffprobe"):
+                    member.name = name
+                    extract_member(tf, member, FFMPEG_DIR)
+                    os.chmod(FFMPEG_DIR / name, 0o755)
+                    found.add(name)
+        return len(found) == 2
+    except Exception as e:
+        ColorPrint.warning(f"FFmpeg download failed: {e}")
+        return False
+    finally:
+        if xz:
+            xz.stdout.close()
+            feeder.join()
+            xz.wait()
+        if resp is not None:
+            getattr(resp, "release_conn", resp.close)()
+
+def ffmpeg_needs_sudo():
+    """Whether setup_ffmpeg will fall through to sudo apt-get"""
+    return (not SYS.has_ffmpeg and not (FFMPEG_DIR / "ffmpeg").exists()
+            and SYS.system == "linux" and SYS.has_apt)
+
 def setup_ffmpeg():
     """Download or locate ffmpeg"""
     ColorPrint.header("Setting up FFmpeg")
     
     # First check if ffmpeg is already installed
-    if shutil.which("ffmpeg"):
+    if SYS.has_ffmpeg:
         ColorPrint.success("FFmpeg found in system PATH")
         return True
     
@@ -304,23 +694,24 @@ def setup_ffmpeg():
         ColorPrint.info("FFmpeg already installed locally")
         return True
     
-    system, arch = check_system()
+    system = SYS.system
     
     # Try to install via package manager
     ColorPrint.info("Attempting to install FFmpeg...")
     
     if system == "darwin":
         # Check for Homebrew
-        if shutil.which("brew"):
+        if SYS.has_brew:
             ColorPrint.info("Installing FFmpeg via Homebrew...")
-            if run_command("brew install ffmpeg"):
+            if run_command(["brew", "install", "ffmpeg"]):
                 ColorPrint.success("FFmpeg installed via Homebrew")
                 return True
     elif system == "linux":
         # Try apt-get
-        if shutil.which("apt-get"):
+        if SYS.has_apt:
             ColorPrint.info("Installing FFmpeg via apt-get...")
-            if run_command("sudo apt-get update && sudo apt-get install -y ffmpeg"):
+            if (run_command(["sudo", "apt-get", "update"])
+                    and run_command(["sudo", "apt-get", "install", "-y", "ffmpeg"])):
                 ColorPrint.success("FFmpeg installed via apt-get")
                 return True
     
@@ -328,7 +719,13 @@ def setup_ffmpeg():
     ColorPrint.warning("Package manager installation failed, downloading manually...")
     FFMPEG_DIR.mkdir(parents=True, exist_ok=True)
     
-    # For now, we'll require manual installation
+    # Static .tar.xz builds can be unpacked without extra tools
+    url = FFMPEG_URLS.get(system, {}).get(SYS.arch)
+    if url and url.endswith(".tar.xz"):
+        if download_ffmpeg_tarball(url):
+            ColorPrint.success(f"FFmpeg installed to {FFMPEG_DIR}")
+            return True
+    
     ColorPrint.warning("Please install FFmpeg manually:")
     if system == "darwin":
         ColorPrint.info("  brew install ffmpeg")
@@ -360,6 +757,7 @@ source "$VENV_PATH/bin/activate" 2>/dev/null
 export UFPS_HOME
 export UFPS_MODELS_DIR="{MODELS_DIR}"
 export UFPS_RIFE_DIR="{RIFE_DIR}"
+export PATH="{FFMPEG_DIR}:$PATH"
 
 exec python "$SCRIPT_PATH" "$@"
 '''
@@ -386,8 +784,8 @@ def copy_main_script():
     """Copy the main CLI script to installation directory"""
     ColorPrint.header("Installing main script")
     
-    # Convert the original ufps script to use our managed paths
     cli_path = INSTALL_DIR / "cli.py"
+    main_path = INSTALL_DIR / "ufps_main.py"
     
     # Read original script
     original_script = Path("ufps_old")
@@ -395,42 +793,155 @@ def copy_main_script():
         ColorPrint.error("Original ufps script not found")
         return False
     
-    content = original_script.read_text()
-    
-    # Update paths to use environment variables
-    content = content.replace(
-        'RIFE_PATH = Path("/Users/home/dev/ECCV2022-RIFE")',
-        'RIFE_PATH = Path(os.environ.get("UFPS_RIFE_DIR", Path.home() / ".ufps" / "RIFE"))'
-    )
-    content = content.replace(
-        'MODEL_PATH = RIFE_PATH / "train_log"',
-        'MODEL_PATH = Path(os.environ.get("UFPS_MODELS_DIR", Path.home() / ".ufps" / "models"))'
+    # The script takes its path constants from _paths, where they are
+    # defined, so they hold the managed paths from import time on
+    lines = original_script.read_text().splitlines(keepends=True)
+    constants = ("RIFE_PATH =", "MODEL_PATH =")
+    defined = [i for i, line in enumerate(lines) if line.startswith(constants)]
+    if not defined:
+        ColorPrint.error("RIFE_PATH/MODEL_PATH not found in the ufps script")
+        return False
+    lines[defined[0]] = "from _paths import RIFE_PATH, MODEL_PATH\n"
+    for i in reversed(defined[1:]):
+        del lines[i]
+    main_path.write_text("".join(lines))
+    (INSTALL_DIR / "_paths.py").write_text(
+        "# Auto-generated by install.py\n"
+        "from pathlib import Path\n"
+        f"RIFE_PATH = Path({str(RIFE_DIR)!r})\n"
+        f"MODEL_PATH = Path({str(MODELS_DIR)!r})\n"
     )
     
-    cli_path.write_text(content)
+    cli_path.write_text('''#!/usr/bin/env python3
+# UFPS launcher
+# Auto-generated by install.py
+
+import sys
+from pathlib import Path
+
+# ufps_main and _paths live beside this file
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import ufps_main
+
+if __name__ == "__main__":
+    sys.exit(ufps_main.main())
+''')
     cli_path.chmod(0o755)
     
     ColorPrint.success("Main script installed")
     return True
 
-def save_config():
+def load_completed_steps():
+    """Steps recorded as done by a previous run of this installer version"""
+    try:
+        done = json.loads(CONFIG_FILE.read_text()).get("done", {})
+    except (OSError, ValueError):
+        return {}
+    # Entries from other installer versions are stale
+    return {name: version for name, version in done.items() if version == INSTALLER_VERSION}
+
+def save_config(done=None):
     """Save installation configuration"""
     config = {
-        "version": "1.0.0",
+        "version": INSTALLER_VERSION,
         "install_dir": str(INSTALL_DIR),
         "venv_dir": str(VENV_DIR),
         "rife_dir": str(RIFE_DIR),
         "models_dir": str(MODELS_DIR),
         "ffmpeg_dir": str(FFMPEG_DIR),
         "installed_at": str(Path.cwd()),
-        "python_version": f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
+        "python_version": f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
+        "done": done or {}
     }
     
     CONFIG_FILE.write_text(json.dumps(config, indent=2))
     ColorPrint.success("Configuration saved")
+    return True
+
+def venv_python():
+    """Path of the virtual environment's interpreter"""
+    if SYS.system == "windows":
+        return VENV_DIR / "Scripts" / "python.exe"
+    return VENV_DIR / "bin" / "python"
+
+def check_venv():
+    """The virtual environment has an interpreter"""
+    return venv_python().exists()
+
+def check_packages():
+    """The core packages import inside the virtual environment"""
+    if not check_venv():
+        return False
+    ok, _, _ = run_command([venv_python(), "-c", "import torch, torchvision, cv2, numpy"], capture=True)
+    return ok
+
+def check_rife():
+    """The RIFE checkout has its model code"""
+    return (RIFE_DIR / "model").is_dir()
+
+async def run_steps(steps, done):
+    """Run the step DAG, marking verified successes in done; returns True if any step failed"""
+    loop = asyncio.get_running_loop()
+    tasks = {}
+    failed = False
+    aborted = False
+    
+    async def call(desc, fn):
+        """Run fn on the executor; an exception counts as a False result"""
+        try:
+            return await loop.run_in_executor(executor, fn)
+        except Exception as e:
+            ColorPrint.error(f"{desc}: {e}")
+            return False
+    
+    async def run(desc):
+        """Run one step once its deps finish; returns True if it actually ran"""
+        nonlocal failed, aborted
+        func, deps, check = steps[desc]
+        deps_ran = await asyncio.gather(*(tasks[dep] for dep in deps))
+        if aborted:
+            return False  # A critical step failed upstream
+        
+        # A cached step is skipped only if nothing it builds on was redone
+        # and its outputs are still there and intact
+        cached = desc in done and check is not None and not any(deps_ran)
+        if cached and await call(desc, check):
+            ColorPrint.info(f"Skipping: {desc} (already done)")
+            return False
+        done.pop(desc, None)
+        
+        if await call(desc, func):
+            # Some steps report success without their outputs (e.g. models
+            # left for a manual download) - cache only what checks out
+            if check is not None and await call(desc, check):
+                done[desc] = INSTALLER_VERSION
+        else:
+            ColorPrint.error(f"Failed: {desc}")
+            failed = True
+            if desc in ["Creating Python environment", "Setting up RIFE"]:
+                aborted = True  # Critical failures
+        return True
+    
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        # Every task exists before any of them starts awaiting its deps
+        for desc in steps:
+            tasks[desc] = asyncio.ensure_future(run(desc))
+        await asyncio.gather(*tasks.values())
+    
+    return failed
 
 def main():
     """Main installation process"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Install UFPS")
+    parser.add_argument("--skip-precompile", action="store_true",
+                      help="Don't precompile the virtual environment's bytecode (e.g. in CI)")
+    parser.add_argument("--force", action="store_true",
+                      help="Rerun every step, even those completed by a previous install")
+    # Tolerate flags such as the Makefile's --dev that aren't handled yet
+    args, _ = parser.parse_known_args()
+    
     print("""
 ╔═══════════════════════════════════════╗
 ║          UFPS INSTALLER v1.0          ║
@@ -444,30 +955,47 @@ def main():
     
     ColorPrint.info(f"System: {system} ({arch})")
     ColorPrint.info(f"Python: {sys.version.split()[0]}")
+    ColorPrint.info(f"Hashing: {ssl.OPENSSL_VERSION}")
     ColorPrint.info(f"Install directory: {INSTALL_DIR}")
     
     # Create main directory
     INSTALL_DIR.mkdir(parents=True, exist_ok=True)
     
-    # Installation steps
-    steps = [
-        ("Creating Python environment", setup_virtual_environment),
-        ("Installing Python packages", install_python_packages),
-        ("Setting up RIFE", setup_rife),
-        ("Downloading AI models", download_models),
-        ("Setting up FFmpeg", setup_ffmpeg),
-        ("Installing main script", copy_main_script),
-        ("Creating executable", create_wrapper_script),
-        ("Saving configuration", save_config)
-    ]
+    # Installation steps as a DAG: step -> (function, steps it waits for,
+    # output check). Everything after the virtual environment is independent
+    # and mostly network-bound, so those steps run concurrently. Only steps
+    # with a check are cached; the cheap ones always rerun so a reinstall
+    # refreshes the script and wrapper.
+    venv_step = "Creating Python environment"
+    steps = {
+        venv_step: (setup_virtual_environment, [], check_venv),
+        "Installing Python packages": (install_python_packages, [venv_step], check_packages),
+        "Setting up RIFE": (setup_rife, [venv_step], check_rife),
+        "Downloading AI models": (download_models, [venv_step], verify_models),
+        "Setting up FFmpeg": (setup_ffmpeg, [venv_step], None),
+        "Installing main script": (copy_main_script, [
+            "Installing Python packages", "Setting up RIFE",
+            "Downloading AI models", "Setting up FFmpeg"
+        ], None),
+        "Creating executable": (create_wrapper_script, ["Installing main script"], None),
+    }
+    if not args.skip_precompile:
+        steps["Precompiling bytecode"] = (precompile_venv, ["Installing Python packages"], check_venv)
     
-    failed = False
-    for desc, func in steps:
-        if not func():
-            ColorPrint.error(f"Failed: {desc}")
-            failed = True
-            if desc in ["Creating Python environment", "Setting up RIFE"]:
-                break  # Critical failures
+    # Ask for the sudo password now, while nothing else is printing; the
+    # cached credentials then let apt-get run inside the concurrent steps
+    if ffmpeg_needs_sudo():
+        ColorPrint.info("FFmpeg will be installed with apt-get, which needs sudo")
+        if not run_command(["sudo", "-v"]):
+            ColorPrint.warning("sudo unavailable, FFmpeg will be downloaded instead")
+            SYS.has_apt = False  # Don't prompt again mid-install
+    
+    # Steps finished by an earlier run of this installer version are skipped
+    done = {} if args.force else load_completed_steps()
+    failed = asyncio.run(run_steps(steps, done))
+    
+    # Record progress even after a failure so a retry resumes where this left off
+    save_config(done)
     
     print("\n" + "="*40)
     
@@ -6,19 +6,58 @@ More detailed testing with better control
 
 import os
 import sys
+import errno
+import asyncio
 import shutil
 import subprocess
 import tempfile
 import json
 import time
+import functools
 from pathlib import Path
 from datetime import datetime
 
+from install import load_manifest, sha256_file
+
 # Test configuration
 INSTALL_DIR = Path.home() / ".ufps"
 BIN_PATH = Path.home() / ".local" / "bin" / "ufps"
 TEST_VIDEO_URL = "https://sample-videos.com/video321/mp4/720/big_buck_bunny_720p_1mb.mp4"
 
+# Imports each module named in argv and reports True or the error as JSON
+IMPORT_PROBE = """
+import importlib, json, sys
+result = {}
+for module in sys.argv[1:]:
+    try:
+        importlib.import_module(module)
+        result[module] = True
+    except Exception as e:
+        result[module] = f"{type(e).__name__}: {e}"
+print(json.dumps(result))
+"""
+
+def _scandir_recursive(path):
+    """Yield DirEntry objects below path, depth-first"""
+    with os.scandir(path) as it:
+        for entry in it:
+            yield entry
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scandir_recursive(entry.path)
+
+@functools.lru_cache(maxsize=None)
+def _which(cmd):
+    """shutil.which, resolved once per run"""
+    return shutil.which(cmd)
+
+def _list_dir(path):
+    """Names directly inside path, or an empty set if it is missing"""
+    try:
+        with os.scandir(path) as it:
+            return {entry.name for entry in it}
+    except OSError:
+        return set()
+
 class TestColors:
     """Terminal colors for test output"""
     GREEN = '\033[92m'
@@ -31,13 +70,23 @@ class TestColors:
     ENDC = '\033[0m'
     BOLD = '\033[1m'
 
+# Plain text when piped to a log, so escapes don't end up in CI output
+if not sys.stdout.isatty():
+    for _name in ("GREEN", "RED", "YELLOW", "BLUE", "MAGENTA", "CYAN", "WHITE", "ENDC", "BOLD"):
+        setattr(TestColors, _name, "")
+
 class InstallationTester:
-    def __init__(self, clean_install=False, verbose=False):
+    def __init__(self, clean_install=False, verbose=False, skip_model_backup=False):
         self.clean_install = clean_install
         self.verbose = verbose
-        self.backup_dir = Path(tempfile.mkdtemp(prefix="ufps_backup_"))
+        self.skip_model_backup = skip_model_backup
+        self.backup_dir = None  # Created on first use by backup_existing
         self.test_results = []
         self.original_exists = False
+        self.output_lock = None
+        # Snapshot of the installed tree, taken after the fresh install
+        self.installed = set()
+        self.bin_exists = False
         
     def print_header(self, text):
         """Print section header"""
@@ -67,31 +116,66 @@ class InstallationTester:
         """Print warning message"""
         print(f"  {TestColors.YELLOW}⚠{TestColors.ENDC} {msg}")
     
+    def _ensure_backup_dir(self):
+        """Create the backup directory next to the install, once"""
+        if self.backup_dir is None:
+            # Same filesystem as the install so the restore is a rename
+            self.backup_dir = Path(tempfile.mkdtemp(prefix="ufps_backup_", dir=INSTALL_DIR.parent))
+        return self.backup_dir
+    
     def backup_existing(self):
         """Backup existing installation"""
         if INSTALL_DIR.exists():
+            self._ensure_backup_dir()
             self.original_exists = True
             self.print_info(f"Backing up existing installation to {self.backup_dir}")
-            shutil.copytree(INSTALL_DIR, self.backup_dir / "ufps")
+            # Copy, so non-clean runs still install over the existing tree
+            shutil.copytree(INSTALL_DIR, self.backup_dir / "ufps", ignore=self._backup_ignore)
             
         if BIN_PATH.exists():
+            self._ensure_backup_dir()
             shutil.copy2(BIN_PATH, self.backup_dir / "ufps_bin")
     
     def restore_backup(self):
         """Restore original installation"""
         if self.original_exists:
             self.print_info("Restoring original installation...")
+            backup = self.backup_dir / "ufps"
             if INSTALL_DIR.exists():
+                # Models left out of the backup come from the tested install
+                if not (backup / "models").exists() and (INSTALL_DIR / "models").exists():
+                    os.rename(INSTALL_DIR / "models", backup / "models")
                 shutil.rmtree(INSTALL_DIR)
-            shutil.copytree(self.backup_dir / "ufps", INSTALL_DIR)
+            self._move_tree(backup, INSTALL_DIR)
             
             if (self.backup_dir / "ufps_bin").exists():
                 BIN_PATH.parent.mkdir(parents=True, exist_ok=True)
                 shutil.copy2(self.backup_dir / "ufps_bin", BIN_PATH)
     
+    def _backup_ignore(self, directory, names):
+        """copytree filter: optionally leave models/ out, they can be re-downloaded"""
+        if self.skip_model_backup and Path(directory) == INSTALL_DIR:
+            return [name for name in names if name == "models"]
+        return []
+    
+    def _move_tree(self, src, dst):
+        """Rename a tree, copying only when it crosses filesystems"""
+        try:
+            os.rename(src, dst)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            shutil.copytree(src, dst)
+            shutil.rmtree(src)
+    
     def cleanup(self):
         """Clean up test artifacts"""
-        if self.backup_dir.exists():
+        if self.backup_dir is None:
+            return
+        if (self.backup_dir / "ufps").exists():
+            # The restore didn't finish - the backup may be the only copy
+            self.print_warning(f"Original installation left in {self.backup_dir}")
+        elif self.backup_dir.exists():
             shutil.rmtree(self.backup_dir)
     
     def run_command(self, cmd, capture=True):
@@ -118,7 +202,7 @@ class InstallationTester:
             return False
         
         # Git
-        if shutil.which("git"):
+        if _which("git"):
             self.print_success("Git is installed")
         else:
             self.print_fail("Git not found")
@@ -156,16 +240,18 @@ class InstallationTester:
             return False
         
         # Verify structure
+        self.installed = _list_dir(INSTALL_DIR)
+        self.bin_exists = BIN_PATH.exists()
         checks = [
-            (INSTALL_DIR, "Installation directory"),
-            (INSTALL_DIR / "venv", "Virtual environment"),
-            (INSTALL_DIR / "cli.py", "Main CLI script"),
-            (INSTALL_DIR / "config.json", "Configuration file"),
-            (BIN_PATH, "Executable wrapper"),
+            (INSTALL_DIR.exists(), "Installation directory"),
+            ("venv" in self.installed, "Virtual environment"),
+            ("cli.py" in self.installed, "Main CLI script"),
+            ("config.json" in self.installed, "Configuration file"),
+            (self.bin_exists, "Executable wrapper"),
         ]
         
-        for path, desc in checks:
-            if path.exists():
+        for present, desc in checks:
+            if present:
                 self.print_success(f"{desc} created")
             else:
                 self.print_fail(f"{desc} not found")
@@ -180,10 +266,8 @@ class InstallationTester:
         
         return True
     
-    def test_python_packages(self):
+    async def test_python_packages(self):
         """Test 3: Verify Python packages"""
-        self.print_test("Test 3: Python Package Verification")
-        
         venv_python = INSTALL_DIR / "venv" / "bin" / "python"
         if not venv_python.exists():
             venv_python = INSTALL_DIR / "venv" / "Scripts" / "python.exe"  # Windows
@@ -198,29 +282,58 @@ class InstallationTester:
             "questionary": "Questionary (CLI prompts)"
         }
         
+        # One interpreter start for every import instead of one per package
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                str(venv_python), "-c", IMPORT_PROBE, *packages,
+                stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+            )
+            stdout, stderr = await proc.communicate()
+        except OSError as e:
+            stdout, stderr = b"", str(e).encode()
+        
+        async with self.output_lock:
+            self.print_test("Test 3: Python Package Verification")
+            self._report_packages(packages, stdout, stderr)
+        
+        return True
+    
+    def _report_packages(self, packages, stdout, stderr):
+        """Print the outcome of the import probe"""
+        try:
+            imported = json.loads(stdout)
+        except ValueError:
+            imported = {}
+            if self.verbose:
+                print("STDERR:", stderr.decode(errors="replace"))
+        
         for module, name in packages.items():
-            cmd = f'"{venv_python}" -c "import {module}"'
-            success, _, _ = self.run_command(cmd)
-            if success:
+            if imported.get(module) is True:
                 self.print_success(f"{name} installed")
             else:
                 self.print_fail(f"{name} not found")
-        
-        return True
+                if self.verbose and module in imported:
+                    self.print_info(f"  {imported[module]}")
     
-    def test_rife_setup(self):
+    async def test_rife_setup(self):
         """Test 4: RIFE and models"""
+        async with self.output_lock:
+            return self._check_rife_setup()
+    
+    def _check_rife_setup(self):
+        """Check the RIFE checkout and model files"""
         self.print_test("Test 4: RIFE and Model Setup")
         
         # Check RIFE directory
         rife_dir = INSTALL_DIR / "RIFE"
-        if rife_dir.exists():
+        if "RIFE" in self.installed:
             self.print_success("RIFE repository present")
             
             # Check for key RIFE files
             rife_files = ["inference_video.py", "inference_img.py", "model"]
             for file in rife_files:
-                if any(rife_dir.rglob(file + "*")):
+                match = (e for e in _scandir_recursive(rife_dir) if e.name.startswith(file))
+                if next(match, None) is not None:
                     self.print_success(f"RIFE {file} found")
                 else:
                     self.print_warning(f"RIFE {file} not found")
@@ -230,13 +343,21 @@ class InstallationTester:
         
         # Check models
         models_dir = INSTALL_DIR / "models"
-        if models_dir.exists():
-            model_files = list(models_dir.glob("*.pkl"))
+        if "models" in self.installed:
+            with os.scandir(models_dir) as it:
+                model_files = [e for e in it if e.name.endswith(".pkl")]
             if len(model_files) >= 1:  # RIFE_HDv3 only needs flownet.pkl
                 self.print_success(f"AI models present ({len(model_files)} .pkl files)")
+                # Same pinned manifest the installer verifies against
+                expected = load_manifest()
                 for model in model_files:
                     size_mb = model.stat().st_size / 1024 / 1024
-                    self.print_info(f"  {model.name}: {size_mb:.1f} MB")
+                    if model.name not in expected:
+                        self.print_info(f"  {model.name}: {size_mb:.1f} MB")
+                    elif sha256_file(model.path) == expected[model.name]:
+                        self.print_success(f"{model.name} checksum verified ({size_mb:.1f} MB)")
+                    else:
+                        self.print_fail(f"{model.name} checksum mismatch")
                 # Also check for model Python files
                 py_files = list(models_dir.glob("*.py"))
                 if py_files:
@@ -248,31 +369,55 @@ class InstallationTester:
         
         return True
     
-    def test_cli_execution(self):
+    async def _run_cli(self, cwd=None):
+        """Run the installed CLI, answering "q" to the first prompt"""
+        proc = await asyncio.create_subprocess_exec(
+            str(BIN_PATH), cwd=cwd,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+        stdout, _ = await proc.communicate(b"q\n")
+        return stdout.decode(errors="replace")
+    
+    async def test_cli_execution(self):
         """Test 5: CLI execution"""
-        self.print_test("Test 5: CLI Execution")
-        
-        if not BIN_PATH.exists():
-            self.print_fail("Executable not found")
+        if not self.bin_exists:
+            async with self.output_lock:
+                self.print_test("Test 5: CLI Execution")
+                self.print_fail("Executable not found")
             return False
         
         # Try to get help or version
         test_commands = [
-            (f'echo "q" | "{BIN_PATH}"', "Interactive mode"),
-            (f'cd /tmp && echo "q" | "{BIN_PATH}"', "Run from different directory"),
+            (None, "Interactive mode"),
+            ("/tmp", "Run from different directory"),
         ]
+        outputs = await asyncio.gather(*(self._run_cli(cwd) for cwd, _ in test_commands))
         
-        for cmd, desc in test_commands:
-            success, stdout, stderr = self.run_command(cmd)
-            if "UFPS" in stdout or "video" in stdout.lower() or "Ultra FPS" in stdout:
-                self.print_success(f"{desc} works")
-            else:
-                self.print_warning(f"{desc} - unclear output")
-                if self.verbose:
-                    print("Output:", stdout[:200])
+        async with self.output_lock:
+            self.print_test("Test 5: CLI Execution")
+            for (_, desc), stdout in zip(test_commands, outputs):
+                if "UFPS" in stdout or "video" in stdout.lower() or "Ultra FPS" in stdout:
+                    self.print_success(f"{desc} works")
+                else:
+                    self.print_warning(f"{desc} - unclear output")
+                    if self.verbose:
+                        print("Output:", stdout[:200])
         
         return True
     
+    def test_installed_tree(self):
+        """Tests 3-5: read-only probes of the install, run concurrently"""
+        async def probes():
+            self.output_lock = asyncio.Lock()
+            return await asyncio.gather(
+                self.test_python_packages(),
+                self.test_rife_setup(),
+                self.test_cli_execution(),
+            )
+        
+        return all(asyncio.run(probes()))
+    
     def test_reinstallation(self):
         """Test 6: Reinstallation handling"""
         self.print_test("Test 6: Reinstallation Handling")
@@ -356,9 +501,7 @@ class InstallationTester:
             tests = [
                 self.test_prerequisites,
                 self.test_fresh_install,
-                self.test_python_packages,
-                self.test_rife_setup,
-                self.test_cli_execution,
+                self.test_installed_tree,
                 self.test_reinstallation,
                 self.test_uninstallation,
                 # self.test_edge_cases,
@@ -412,12 +555,15 @@ def main():
                       help="Show detailed output")
     parser.add_argument("--quick", action="store_true",
                       help="Run quick tests only (skip download-heavy tests)")
+    parser.add_argument("--skip-model-backup", action="store_true",
+                      help="Don't copy models/ into the backup; the tested install's are kept")
     
     args = parser.parse_args()
     
     tester = InstallationTester(
         clean_install=args.clean,
-        verbose=args.verbose
+        verbose=args.verbose,
+        skip_model_backup=args.skip_model_backup
     )
     
     try:
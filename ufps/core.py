@@ -3,13 +3,180 @@ Core video processing and interpolation functionality
 """
 
 import os
+import sys
+import json
+import types
+import functools
+import string
+import threading
 import subprocess
 import shutil
 import tempfile
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import math
+import time
 from datetime import datetime
 
+# Characters kept as-is in temp directory names; anything else becomes "_"
+_ALLOWED = set(string.ascii_letters + string.digits + "._-")
+
+
+class _SanitizeTable(dict):
+    """str.translate table: allowed characters map to themselves, anything else to _"""
+    
+    def __missing__(self, codepoint):
+        return "_"
+
+
+_SAN_TABLE = _SanitizeTable({ord(c): ord(c) for c in _ALLOWED})
+
+
+@functools.lru_cache(maxsize=16)
+def _encode_argv(ffmpeg, fps, crf, has_audio):
+    """ffmpeg argv template for encoding frames; placeholders filled per call"""
+    argv = [ffmpeg, '-r', str(fps), '-i', '__FRAMES__']
+    if has_audio:
+        argv += ['-i', '__AUDIO__']
+    argv += ['-c:v', 'libx264', '-crf', str(crf), '-preset', 'slow', '-pix_fmt', 'yuv420p']
+    if has_audio:
+        argv += ['-c:a', 'copy']
+    argv += ['__OUTPUT__', '-loglevel', 'error', '-y']
+    return tuple(argv)
+
+
+@functools.lru_cache(maxsize=16)
+def _extract_argv(ffmpeg, quality):
+    """ffmpeg argv template for extracting PNG frames"""
+    # Frames are scratch data read back once by RIFE, so trade a little
+    # disk for much cheaper deflate (PNG encoding dominates extraction)
+    return (
+        ffmpeg,
+        '-i', '__INPUT__',
+        '-qscale:v', str(quality),
+        '-qmin', '1',
+        '-compression_level', '1',
+        '__FRAMES__',
+        '-loglevel', 'error'
+    )
+
+
+def _fill_argv(template, **values):
+    """Substitute __NAME__ placeholders in a cached argv template"""
+    return [str(values[arg[2:-2].lower()]) if arg.startswith('__') else arg for arg in template]
+
+
+def _as_path(path):
+    """Path for a str or PathLike, reusing an existing Path object"""
+    return path if isinstance(path, Path) else Path(path)
+
+
+def _count_pngs(directory):
+    """Count PNG files in a directory without building Path objects"""
+    with os.scandir(directory) as it:
+        return sum(1 for e in it if e.name.endswith(".png") and e.is_file(follow_symlinks=False))
+
+
+def _list_pngs(directory):
+    """Sorted PNG file names in a directory"""
+    with os.scandir(directory) as it:
+        return sorted(e.name for e in it if e.name.endswith(".png"))
+
+
+def _split_bounds(count, workers):
+    """(first, last) index ranges over count frames; neighbours share a boundary frame"""
+    if count < 2:
+        return [(0, count - 1)] if count else []
+    step = math.ceil((count - 1) / workers)
+    return [(i, min(i + step, count - 1)) for i in range(0, count - 1, step)]
+
+
+def _make_temp_dir(input_path, estimate=None):
+    """Scratch directory named after the input, on tmpfs when estimate bytes fit"""
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    safe_stem = input_path.stem[:20].translate(_SAN_TABLE)
+    return Path(tempfile.mkdtemp(prefix=f"ufps_{safe_stem}_{timestamp}_",
+                                 dir=_best_tmp_root(estimate)))
+
+
+def _warm_file(path):
+    """Pull a file into the page cache"""
+    with open(path, 'rb', buffering=0) as f:
+        if hasattr(os, "posix_fadvise"):
+            # Kernel readahead does the work asynchronously
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+        else:
+            while f.read(1 << 20):
+                pass
+
+
+def _best_tmp_root(estimate=None):
+    """Prefer RAM-backed /dev/shm for scratch frames when they comfortably fit"""
+    shm = "/dev/shm"
+    if estimate and os.path.isdir(shm):
+        try:
+            if shutil.disk_usage(shm).free > 2 * estimate:
+                return shm
+        except OSError:
+            pass
+    return tempfile.gettempdir()
+
+
+def _mark_temporary(path):
+    """Hint Windows' cache manager to keep a scratch file out of lazy writes"""
+    if sys.platform == "win32":
+        import ctypes
+        FILE_ATTRIBUTE_TEMPORARY = 0x100
+        ctypes.windll.kernel32.SetFileAttributesW(str(path), FILE_ATTRIBUTE_TEMPORARY)
+
+
+def _prefetch_frames(directory, workers=8):
+    """Warm the page cache for every frame in the background, without blocking"""
+    executor = ThreadPoolExecutor(max_workers=workers)
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.name.endswith(".png"):
+                executor.submit(_warm_file, entry.path)
+    executor.shutdown(wait=False)
+
+
+class _PNGWriter:
+    """Encode PNGs with OpenCV on a bounded thread pool"""
+    
+    def __init__(self, workers=None):
+        import cv2
+        
+        self._imwrite = cv2.imwrite
+        # Frames are temporary, so favour speed over size (libpng defaults to 6)
+        self._params = [cv2.IMWRITE_PNG_COMPRESSION, 1]
+        self._mark = sys.platform == "win32"
+        workers = workers or os.cpu_count() or 4
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+        # Cap queued frames so a fast producer can't exhaust memory
+        self._slots = threading.BoundedSemaphore(workers * 2)
+        self._futures = []
+    
+    def write(self, path, img):
+        self._slots.acquire()
+        future = self._executor.submit(self._encode, str(path), img)
+        future.add_done_callback(lambda _: self._slots.release())
+        self._futures.append(future)
+    
+    def _encode(self, path, img):
+        ok = self._imwrite(path, img, self._params)
+        if ok and self._mark:
+            _mark_temporary(path)
+        return ok
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self._executor.shutdown(wait=True)
+        if exc_type is None and not all(f.result() for f in self._futures):
+            raise RuntimeError("Failed to write frames")
+
+
 class VideoProcessor:
     """Handles video extraction and encoding"""
     
@@ -20,26 +187,157 @@ class VideoProcessor:
         if not self.ffmpeg or not self.ffprobe:
             raise RuntimeError("FFmpeg not found. Please install ffmpeg.")
     
-    def extract_frames(self, video_path, output_dir, quality=1):
-        """Extract frames from video"""
-        output_dir = Path(output_dir)
+    def frame_size(self, video_path):
+        """Width and height of decoded frames, accounting for rotation"""
+        cmd = [
+            self.ffprobe,
+            '-v', 'error',
+            '-select_streams', 'v:0',
+            '-show_entries', 'stream=width,height:stream_side_data=rotation',
+            '-of', 'json',
+            str(video_path)
+        ]
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(f"Failed to probe video: {result.stderr}")
+        
+        stream = json.loads(result.stdout)['streams'][0]
+        width, height = stream['width'], stream['height']
+        rotation = next((d['rotation'] for d in stream.get('side_data_list', []) if 'rotation' in d), 0)
+        # ffmpeg autorotates while decoding
+        if abs(int(rotation)) % 180 == 90:
+            width, height = height, width
+        return width, height
+    
+    def probe_frames(self, video_path):
+        """(width, height, frame count) of decoded frames from container metadata, or None"""
+        cmd = [
+            self.ffprobe,
+            '-v', 'error',
+            '-select_streams', 'v:0',
+            '-show_entries', 'stream=width,height,nb_frames,r_frame_rate:stream_side_data=rotation:format=duration',
+            '-of', 'json',
+            str(video_path)
+        ]
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        if result.returncode != 0:
+            return None
+        
+        try:
+            info = json.loads(result.stdout)
+            stream = info['streams'][0]
+            frames = int(stream.get('nb_frames') or 0)
+            if not frames:
+                num, den = stream['r_frame_rate'].split('/')
+                frames = math.ceil(float(info['format']['duration']) * int(num) / int(den))
+            width, height = stream['width'], stream['height']
+            rotation = next((d['rotation'] for d in stream.get('side_data_list', []) if 'rotation' in d), 0)
+            # ffmpeg autorotates while decoding
+            if abs(int(rotation)) % 180 == 90:
+                width, height = height, width
+            return width, height, frames
+        except (KeyError, IndexError, ValueError, ZeroDivisionError):
+            return None
+    
+    @staticmethod
+    def estimate_frame_bytes(probe, scale=2):
+        """Rough upper bound on scratch space for extracted and interpolated frames"""
+        if not probe:
+            return None
+        width, height, frames = probe
+        # Fast-deflate PNGs are close to raw size; originals plus interpolated
+        return width * height * 3 * frames * (1 + scale)
+    
+    def _run_ffmpeg(self, cmd, action, progress=None):
+        """Run ffmpeg, feeding its -progress frame counter to progress(frame)"""
+        cmd = [cmd[0], '-progress', 'pipe:2', '-nostats'] + cmd[1:]
+        proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                                text=True, bufsize=1)
+        
+        errors = []
+        frame = 0
+        last_report = 0.0
+        for line in proc.stderr:
+            key, sep, value = line.strip().partition('=')
+            if not sep or ' ' in key:
+                errors.append(line)
+            elif key == 'frame':
+                frame = int(value)
+            elif key == 'progress' and progress:
+                # Blocks arrive about twice a second; report at most once
+                now = time.monotonic()
+                if value == 'end' or now - last_report >= 1:
+                    last_report = now
+                    progress(frame)
+        
+        if proc.wait() != 0:
+            raise RuntimeError(f"Failed to {action}: {''.join(errors)}")
+    
+    def extract_frames(self, video_path, output_dir, quality=1, progress=None, size=None):
+        """Extract frames from video; size is (width, height) if already probed"""
+        output_dir = _as_path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
         
+        try:
+            return self._extract_frames_parallel(video_path, output_dir, progress, size)
+        except ImportError:
+            pass  # No OpenCV - let ffmpeg write the PNGs itself
+        
+        cmd = _fill_argv(
+            _extract_argv(self.ffmpeg, quality),
+            input=video_path, frames=os.path.join(os.fspath(output_dir), "frame_%08d.png")
+        )
+        
+        self._run_ffmpeg(cmd, "extract frames", progress)
+        return _count_pngs(output_dir)
+    
+    def _extract_frames_parallel(self, video_path, output_dir, progress=None, size=None):
+        """Decode raw frames from ffmpeg and PNG-encode them on every core"""
+        import numpy as np
+        
+        width, height = size or self.frame_size(video_path)
+        frame_bytes = width * height * 3
+        
         cmd = [
             self.ffmpeg,
             '-i', str(video_path),
-            '-qscale:v', str(quality),
-            '-qmin', '1',
-            str(output_dir / "frame_%08d.png"),
-            '-loglevel', 'error'
+            # Decode the stream that was probed, not ffmpeg's "best" pick
+            '-map', '0:v:0',
+            '-f', 'rawvideo',
+            '-pix_fmt', 'bgr24',
+            '-loglevel', 'error',
+            'pipe:1'
         ]
         
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        if result.returncode != 0:
-            raise RuntimeError(f"Failed to extract frames: {result.stderr}")
+        pattern = os.path.join(os.fspath(output_dir), "frame_{:08d}.png")
         
-        frames = list(output_dir.glob("*.png"))
-        return len(frames)
+        with _PNGWriter() as writer:
+            proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            try:
+                count = 0
+                last_report = 0.0
+                while True:
+                    buf = bytearray(frame_bytes)
+                    if proc.stdout.readinto(buf) < frame_bytes:
+                        break
+                    count += 1
+                    frame = np.frombuffer(buf, dtype=np.uint8).reshape(height, width, 3)
+                    writer.write(pattern.format(count), frame)
+                    if progress and time.monotonic() - last_report >= 1:
+                        last_report = time.monotonic()
+                        progress(count)
+                stderr = proc.stderr.read().decode('utf-8', 'replace')
+                if proc.wait() != 0:
+                    raise RuntimeError(f"Failed to extract frames: {stderr}")
+            finally:
+                # Don't leave ffmpeg blocked on a pipe nobody reads
+                if proc.poll() is None:
+                    proc.kill()
+                proc.wait()
+                proc.stdout.close()
+                proc.stderr.close()
+        
+        return count
     
     def extract_audio(self, video_path, output_path):
         """Extract audio track from video"""
@@ -54,45 +352,18 @@ class VideoProcessor:
         ]
         
         result = subprocess.run(cmd, capture_output=True, text=True)
-        return output_path if Path(output_path).exists() else None
+        return output_path if os.path.exists(output_path) else None
     
-    def encode_video(self, frames_dir, output_path, fps, audio_path=None, crf=18):
+    def encode_video(self, frames_dir, output_path, fps, audio_path=None, crf=18, progress=None):
         """Encode frames to video"""
-        frames_dir = Path(frames_dir)
-        
-        if audio_path and Path(audio_path).exists():
-            cmd = [
-                self.ffmpeg,
-                '-r', str(fps),
-                '-i', str(frames_dir / "frame_%08d.png"),
-                '-i', str(audio_path),
-                '-c:v', 'libx264',
-                '-crf', str(crf),
-                '-preset', 'slow',
-                '-pix_fmt', 'yuv420p',
-                '-c:a', 'copy',
-                str(output_path),
-                '-loglevel', 'error',
-                '-y'
-            ]
-        else:
-            cmd = [
-                self.ffmpeg,
-                '-r', str(fps),
-                '-i', str(frames_dir / "frame_%08d.png"),
-                '-c:v', 'libx264',
-                '-crf', str(crf),
-                '-preset', 'slow',
-                '-pix_fmt', 'yuv420p',
-                str(output_path),
-                '-loglevel', 'error',
-                '-y'
-            ]
-        
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        if result.returncode != 0:
-            raise RuntimeError(f"Failed to encode video: {result.stderr}")
+        has_audio = bool(audio_path) and os.path.exists(audio_path)
+        cmd = _fill_argv(
+            _encode_argv(self.ffmpeg, fps, crf, has_audio),
+            frames=os.path.join(os.fspath(frames_dir), "frame_%08d.png"),
+            audio=audio_path, output=output_path
+        )
         
+        self._run_ffmpeg(cmd, "encode video", progress)
         return output_path
 
 
@@ -100,119 +371,336 @@ class RIFEInterpolator:
     """Handles RIFE model interpolation"""
     
     def __init__(self, rife_dir=None, models_dir=None):
+        self.rife_dir, self.models_dir = self.locate(rife_dir, models_dir)
+        
+        # Add RIFE to Python path
+        sys.path.insert(0, str(self.rife_dir))
+        
+        try:
+            batch_size = int(os.environ.get("UFPS_BATCH", 8))
+        except ValueError:
+            batch_size = 8
+        self.batch_size = max(1, batch_size)
+        self.precision = os.environ.get("UFPS_PRECISION", "fp16").lower()
+        self.model = self._load_model()
+        
+        # Fallback when the model can't be loaded in-process
+        self.script = None
+        self._supports_modeldir = False
+        if self.model is None:
+            self.script = self._find_script()
+            self._supports_modeldir = self._accepts_modeldir()
+    
+    @staticmethod
+    def locate(rife_dir=None, models_dir=None):
+        """Resolve the RIFE checkout and models directories, raising if either is missing"""
         # Use environment variables or defaults
-        self.rife_dir = Path(rife_dir or os.environ.get("UFPS_RIFE_DIR", Path.home() / ".ufps" / "RIFE"))
-        self.models_dir = Path(models_dir or os.environ.get("UFPS_MODELS_DIR", Path.home() / ".ufps" / "models"))
+        rife_dir = Path(rife_dir or os.environ.get("UFPS_RIFE_DIR", Path.home() / ".ufps" / "RIFE"))
+        models_dir = Path(models_dir or os.environ.get("UFPS_MODELS_DIR", Path.home() / ".ufps" / "models"))
         
-        if not self.rife_dir.exists():
-            raise RuntimeError(f"RIFE not found at {self.rife_dir}")
+        if not rife_dir.exists():
+            raise RuntimeError(f"RIFE not found at {rife_dir}")
         
-        if not self.models_dir.exists():
-            raise RuntimeError(f"Models not found at {self.models_dir}")
+        if not models_dir.exists():
+            raise RuntimeError(f"Models not found at {models_dir}")
         
-        # Add RIFE to Python path
-        sys.path.insert(0, str(self.rife_dir))
+        return rife_dir, models_dir
     
-    def interpolate(self, input_dir, output_dir, scale=2):
-        """Run RIFE interpolation"""
-        input_dir = Path(input_dir)
-        output_dir = Path(output_dir)
+    @staticmethod
+    def prefetch(models_dir=None):
+        """Start kernel readahead of the checkpoints so loading them doesn't block on disk"""
+        if not hasattr(os, "posix_fadvise"):
+            return
+        models_dir = models_dir or os.environ.get("UFPS_MODELS_DIR", Path.home() / ".ufps" / "models")
+        try:
+            with os.scandir(models_dir) as it:
+                for entry in it:
+                    if entry.name.endswith(".pkl"):
+                        _warm_file(entry.path)
+        except OSError:
+            pass  # __init__ reports a missing models directory
+    
+    def _find_script(self):
+        """First RIFE inference script present in the checkout"""
+        for script in ["inference_video.py", "inference_img.py", "inference.py"]:
+            script_path = self.rife_dir / script
+            if script_path.exists():
+                return script_path
+        return None
+    
+    def _accepts_modeldir(self):
+        """Whether the script takes --modelDir, checked once via --help"""
+        if self.script is None:
+            return False
+        result = subprocess.run(
+            [sys.executable, str(self.script), '--help'],
+            capture_output=True, text=True, cwd=self.rife_dir
+        )
+        return '--modelDir' in result.stdout
+    
+    def _load_model(self):
+        """Load RIFE in-process once; None means fall back to RIFE's scripts"""
+        try:
+            import torch
+            
+            # RIFE_HDv3.py imports its network from "train_log", which is
+            # where RIFE keeps models - point that package at models_dir
+            train_log = types.ModuleType("train_log")
+            train_log.__path__ = [str(self.models_dir)]
+            sys.modules.setdefault("train_log", train_log)
+            from train_log.RIFE_HDv3 import Model
+            
+            model = Model()
+            model.load_model(str(self.models_dir), -1)
+            model.eval()
+            model.device()
+            return model
+        except (ImportError, FileNotFoundError):
+            # No torch, or a RIFE fork without RIFE_HDv3/its checkpoints
+            return None
+        except Exception as e:
+            # CUDA OOM, a corrupt checkpoint, broken RIFE code: don't mask it
+            raise RuntimeError(f"Failed to load RIFE model: {e}") from e
+    
+    def _autocast_dtype(self, device):
+        """Reduced-precision dtype for inference, or None to stay in FP32"""
+        import torch
+        
+        # Tensor cores (Volta+) are what make half precision pay off
+        if self.precision == "fp32" or device.type != "cuda":
+            return None
+        if torch.cuda.get_device_capability(device)[0] < 7:
+            return None
+        if self.precision == "bf16" and torch.cuda.is_bf16_supported():
+            return torch.bfloat16
+        return torch.float16
+    
+    def _interpolate_in_process(self, input_dir, output_dir, exp_value):
+        """Interpolate consecutive frame pairs with the loaded model, in batches"""
+        import cv2
+        import torch
+        import torch.nn.functional as F
+        
+        frames = [os.path.join(input_dir, name) for name in _list_pngs(input_dir)]
+        if not frames:
+            raise RuntimeError("No frames to interpolate")
+        device = next(self.model.flownet.parameters()).device
+        
+        def load(paths):
+            imgs = [torch.from_numpy(cv2.imread(p, cv2.IMREAD_COLOR).transpose(2, 0, 1)) for p in paths]
+            batch = torch.stack(imgs)
+            if device.type == "cuda":
+                # Page-locked memory lets the copy overlap with compute
+                batch = batch.pin_memory()
+            batch = batch.to(device, non_blocking=True).float() / 255.
+            return F.pad(batch, padding)
+        
+        # RIFE needs dimensions padded to a multiple of 32
+        h, w = cv2.imread(frames[0], cv2.IMREAD_COLOR).shape[:2]
+        padding = (0, (32 - w % 32) % 32, 0, (32 - h % 32) % 32)
+        
+        written = 0
+        pattern = os.path.join(os.fspath(output_dir), "frame_{:08d}.png")
+        
+        def save(tensor):
+            nonlocal written
+            written += 1
+            img = (tensor[:, :h, :w] * 255).round().clamp(0, 255).byte()
+            img = img.permute(1, 2, 0).contiguous().cpu().numpy()
+            writer.write(pattern.format(written), img)
+        
+        def between(img0, img1, depth):
+            # Recursive midpoints give 2^depth - 1 evenly spaced frames
+            if depth == 0:
+                return []
+            mid = self.model.inference(img0, img1)
+            return between(img0, mid, depth - 1) + [mid] + between(mid, img1, depth - 1)
+        
+        dtype = self._autocast_dtype(device)
+        autocast = torch.autocast(device_type=device.type, dtype=dtype, enabled=dtype is not None)
+        
+        with torch.no_grad(), autocast, _PNGWriter() as writer:
+            # Each batch stacks up to batch_size (img0, img1) pairs along dim 0
+            for start in range(0, len(frames) - 1, self.batch_size):
+                window = load(frames[start:start + self.batch_size + 1])
+                img0, img1 = window[:-1], window[1:]
+                mids = between(img0, img1, exp_value)
+                for i in range(img0.shape[0]):
+                    save(img0[i])
+                    for mid in mids:
+                        save(mid[i])
+            save(load(frames[-1:])[0])
+        
+        return written
+    
+    def interpolate(self, input_dir, output_dir, scale=2, device=None):
+        """Run RIFE interpolation, optionally pinned to one CUDA device"""
+        input_dir = _as_path(input_dir)
+        output_dir = _as_path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
         
         # Calculate exponent for RIFE (2^exp = scale)
         exp_value = int(math.log2(scale))
         
-        # Save current directory
-        original_dir = os.getcwd()
+        if self.model is not None:
+            return self._interpolate_in_process(input_dir, output_dir, exp_value)
         
-        try:
-            # Change to RIFE directory
-            os.chdir(self.rife_dir)
-            
-            # Try different inference scripts
-            scripts = ["inference_video.py", "inference_img.py", "inference.py"]
-            
-            for script in scripts:
-                script_path = self.rife_dir / script
-                if not script_path.exists():
-                    continue
-                
-                cmd = [
-                    sys.executable, str(script_path),
-                    '--img', str(input_dir),
-                    '--output', str(output_dir),
-                    '--exp', str(exp_value),
-                    '--modelDir', str(self.models_dir)
-                ]
-                
-                result = subprocess.run(cmd, capture_output=True, text=True)
-                
-                if result.returncode == 0:
-                    # Check if output was generated
-                    output_frames = list(output_dir.glob("*.png"))
-                    if output_frames:
-                        return len(output_frames)
-                
-                # Try without modelDir parameter
-                cmd = [
-                    sys.executable, str(script_path),
-                    '--img', str(input_dir),
-                    '--output', str(output_dir),
-                    '--exp', str(exp_value)
-                ]
-                
-                result = subprocess.run(cmd, capture_output=True, text=True)
-                
-                if result.returncode == 0:
-                    output_frames = list(output_dir.glob("*.png"))
-                    if output_frames:
-                        return len(output_frames)
-            
+        # Pin the scripts to a single GPU when dispatched per chunk
+        env = None
+        if device is not None:
+            env = {**os.environ, "CUDA_VISIBLE_DEVICES": str(device)}
+        
+        if self.script is None:
             raise RuntimeError("RIFE interpolation failed - no compatible script found")
-            
-        finally:
-            # Restore directory
-            os.chdir(original_dir)
+        
+        cmd = [
+            sys.executable, str(self.script),
+            '--img', str(input_dir),
+            '--output', str(output_dir),
+            '--exp', str(exp_value)
+        ]
+        if self._supports_modeldir:
+            cmd += ['--modelDir', str(self.models_dir)]
+        
+        result = subprocess.run(cmd, capture_output=True, text=True, cwd=self.rife_dir, env=env)
+        if result.returncode != 0:
+            raise RuntimeError(f"RIFE interpolation failed: {result.stderr}")
+        
+        output_frames = _count_pngs(output_dir)
+        if not output_frames:
+            raise RuntimeError("RIFE interpolation produced no frames")
+        return output_frames
+    
+    def interpolate_parallel(self, input_dir, output_dir, scale=2, workers=2):
+        """Split the frames into chunks and interpolate one chunk per GPU"""
+        input_dir = _as_path(input_dir)
+        output_dir = _as_path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        
+        frames = _list_pngs(input_dir)
+        chunks = []
+        for index, (first, last) in enumerate(_split_bounds(len(frames), workers)):
+            chunk_in = output_dir.parent / f"chunk_{index}" / "in"
+            chunk_in.mkdir(parents=True, exist_ok=True)
+            _link_frames(input_dir, frames[first:last + 1], chunk_in)
+            chunks.append(chunk_in)
+        
+        def run(index):
+            chunk_out = chunks[index].parent / "out"
+            self.interpolate(chunks[index], chunk_out, scale, device=index)
+            return chunk_out
+        
+        with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+            outputs = list(executor.map(run, range(len(chunks))))
+        
+        # Stitch, dropping each chunk's last frame (the next chunk's first)
+        written = 0
+        for index, chunk_out in enumerate(outputs):
+            names = _list_pngs(chunk_out)
+            if index < len(outputs) - 1:
+                names = names[:-1]
+            for name in names:
+                written += 1
+                os.replace(chunk_out / name, output_dir / f"frame_{written:08d}.png")
+            shutil.rmtree(chunk_out.parent)
+        
+        return written
+
+
+def _link_frames(source_dir, names, dest_dir):
+    """Hard-link the named frames into dest_dir, copying across filesystems"""
+    dest_dir.mkdir(parents=True, exist_ok=True)
+    for name in names:
+        try:
+            os.link(source_dir / name, dest_dir / name)
+        except OSError:
+            shutil.copy2(source_dir / name, dest_dir / name)
+
+
+def _gpu_count():
+    """Number of visible CUDA devices, 0 without torch"""
+    try:
+        import torch
+        return torch.cuda.device_count()
+    except Exception:
+        return 0
 
 
 def process_video(input_path, output_path, scale=2, target_fps=60, crf=18, progress_callback=None):
     """Main processing pipeline"""
-    input_path = Path(input_path).resolve()
-    output_path = Path(output_path).resolve()
+    # abspath doesn't stat every component the way resolve() does
+    input_path = Path(os.path.abspath(os.fspath(input_path)))
+    output_path = Path(os.path.abspath(os.fspath(output_path)))
     
-    # Create temporary directory
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    safe_stem = "".join(c if c.isalnum() or c in "._-" else "_" for c in input_path.stem[:20])
-    temp_dir = Path(tempfile.mkdtemp(prefix=f"ufps_{safe_stem}_{timestamp}_"))
+    video_proc = VideoProcessor()
+    probe = video_proc.probe_frames(input_path)
+    
+    # Long videos on multi-GPU hosts are split into frame ranges rendered in parallel
+    workers = _segment_workers()
+    if workers > 1 and probe and probe[2] >= 2 * MIN_SEGMENT_FRAMES:
+        return _process_segmented(video_proc, input_path, output_path, probe, workers,
+                                  scale, target_fps, crf, progress_callback)
+    
+    return _process_whole(video_proc, input_path, output_path, probe,
+                          scale, target_fps, crf, progress_callback)
+
+
+def _process_whole(video_proc, input_path, output_path, probe, scale, target_fps, crf,
+                   progress_callback=None):
+    """Extract, interpolate and encode one video in a single pass"""
+    # Create temporary directory, on tmpfs when the frames fit
+    temp_dir = _make_temp_dir(input_path, video_proc.estimate_frame_bytes(probe, scale))
     
     try:
         frames_dir = temp_dir / "frames"
         interp_dir = temp_dir / "interpolated"
         
-        # Initialize processors
-        video_proc = VideoProcessor()
-        rife_proc = RIFEInterpolator()
+        # Fail fast on a missing install, then read the checkpoints in while
+        # frames are extracted; the model itself loads once extraction is done
+        rife_dir, models_dir = RIFEInterpolator.locate()
+        RIFEInterpolator.prefetch(models_dir)
+        
+        def stage(message, start, total):
+            """Map a frame counter onto a 25% slice of the overall progress"""
+            if not progress_callback or not total:
+                return None
+            return lambda frame: progress_callback(message, start + 25 * min(frame, total) / total)
         
         # Step 1: Extract frames
         if progress_callback:
             progress_callback("Extracting frames...", 0)
-        frame_count = video_proc.extract_frames(input_path, frames_dir)
+        frame_count = video_proc.extract_frames(
+            input_path, frames_dir,
+            progress=stage("Extracting frames...", 0, probe and probe[2]),
+            size=probe and probe[:2]
+        )
+        
+        # Overlap frame reads with RIFE's slow startup
+        _prefetch_frames(frames_dir)
+        rife_proc = RIFEInterpolator(rife_dir, models_dir)
         
         # Step 2: Run interpolation
         if progress_callback:
             progress_callback(f"Running {scale}× interpolation...", 25)
-        interp_count = rife_proc.interpolate(frames_dir, interp_dir, scale)
+        gpus = _gpu_count()
+        if rife_proc.model is None and gpus > 1 and frame_count > gpus:
+            # The scripts run out of process, so each GPU can take a chunk
+            interp_count = rife_proc.interpolate_parallel(frames_dir, interp_dir, scale, gpus)
+        else:
+            interp_count = rife_proc.interpolate(frames_dir, interp_dir, scale)
         
         # Step 3: Extract audio
         if progress_callback:
             progress_callback("Processing audio...", 50)
-        audio_path = temp_dir / "audio.aac"
-        audio = video_proc.extract_audio(input_path, audio_path)
+        audio = video_proc.extract_audio(input_path, temp_dir / "audio.aac")
         
         # Step 4: Encode final video
         if progress_callback:
             progress_callback("Encoding final video...", 75)
-        video_proc.encode_video(interp_dir, output_path, target_fps, audio, crf)
+        video_proc.encode_video(
+            interp_dir, output_path, target_fps, audio, crf,
+            progress=stage("Encoding final video...", 75, interp_count)
+        )
         
         if progress_callback:
             progress_callback("Complete!", 100)
@@ -222,4 +710,122 @@ def process_video(input_path, output_path, scale=2, target_fps=60, crf=18, progr
     finally:
         # Clean up
         if temp_dir.exists():
-            shutil.rmtree(temp_dir)
\ No newline at end of file
+            shutil.rmtree(temp_dir)
+
+
+# Segments shorter than this many source frames aren't worth a worker's model load
+MIN_SEGMENT_FRAMES = 900
+
+
+def _segment_workers():
+    """Parallel segment renders: two per GPU so decode/encode overlap inference
+    
+    A single GPU gets one, since every worker loads its own copy of the
+    model; UFPS_SEGMENT_WORKERS overrides the count.
+    """
+    try:
+        return max(1, int(os.environ["UFPS_SEGMENT_WORKERS"]))
+    except (KeyError, ValueError):
+        pass
+    gpus = _gpu_count()
+    if gpus < 2:
+        return 1
+    return min(os.cpu_count() or 1, gpus * 2)
+
+
+def _render_segment(job):
+    """Worker entry point: interpolate and encode one frame range on one GPU"""
+    frames_dir, names, segment_dir, output_path, scale, target_fps, crf, drop_last, device = job
+    # Set before torch is imported in this (spawned) process
+    os.environ["CUDA_VISIBLE_DEVICES"] = str(device)
+    
+    segment_in = segment_dir / "in"
+    segment_out = segment_dir / "out"
+    _link_frames(frames_dir, names, segment_in)
+    count = RIFEInterpolator().interpolate(segment_in, segment_out, scale)
+    
+    # The last frame is the next segment's first; that segment renders it
+    if drop_last:
+        (segment_out / f"frame_{count:08d}.png").unlink()
+    
+    VideoProcessor().encode_video(segment_out, output_path, target_fps, None, crf)
+    shutil.rmtree(segment_dir)
+    return output_path
+
+
+def _process_segmented(video_proc, input_path, output_path, probe, workers, scale, target_fps, crf,
+                       progress_callback=None):
+    """Render frame ranges on up to workers processes and join them"""
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    
+    temp_dir = _make_temp_dir(input_path, video_proc.estimate_frame_bytes(probe, scale))
+    try:
+        # Fail here rather than once per worker
+        RIFEInterpolator.locate()
+        
+        # Decode once so segments split on exact frame indices
+        frames_dir = temp_dir / "frames"
+        if progress_callback:
+            progress_callback("Extracting frames...", 0)
+        progress = None
+        if progress_callback:
+            progress = lambda frame: progress_callback(
+                "Extracting frames...", 20 * min(frame, probe[2]) / probe[2])
+        video_proc.extract_frames(input_path, frames_dir, progress=progress, size=probe[:2])
+        
+        frames = _list_pngs(frames_dir)
+        count = max(1, min(workers, (len(frames) - 1) // MIN_SEGMENT_FRAMES))
+        # Neighbouring segments share a boundary frame so no pair is skipped
+        bounds = _split_bounds(len(frames), count)
+        
+        jobs = []
+        gpus = max(_gpu_count(), 1)
+        for index, (first, last) in enumerate(bounds):
+            jobs.append((frames_dir, frames[first:last + 1], temp_dir / f"segment_{index:04d}",
+                         temp_dir / f"rendered_{index:04d}.mp4", scale, target_fps, crf,
+                         index < len(bounds) - 1, index % gpus))
+        
+        # Spawn, not fork: workers each initialise their own CUDA context
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            futures = [pool.submit(_render_segment, job) for job in jobs]
+            for done, future in enumerate(as_completed(futures), 1):
+                future.result()
+                if progress_callback:
+                    progress_callback(f"Rendered {done}/{len(jobs)} segments...", 20 + 70 * done / len(jobs))
+        
+        # Join the segments and take the audio straight from the original
+        if progress_callback:
+            progress_callback("Joining segments...", 90)
+        concat_list = temp_dir / "segments.txt"
+        concat_list.write_text("".join(f"file '{job[3]}'\n" for job in jobs))
+        # Audio the output container can't hold as-is is re-encoded, and
+        # dropped as a last resort, so the rendered video is never lost
+        attempts = [
+            ['-map', '1:a:0?', '-c', 'copy'],
+            ['-map', '1:a:0?', '-c:v', 'copy'],
+            ['-c', 'copy'],
+        ]
+        for audio_args in attempts:
+            cmd = [
+                video_proc.ffmpeg,
+                '-f', 'concat', '-safe', '0', '-i', str(concat_list),
+                '-i', str(input_path),
+                '-map', '0:v', *audio_args,
+                str(output_path),
+                '-loglevel', 'error', '-y'
+            ]
+            result = subprocess.run(cmd, capture_output=True, text=True)
+            if result.returncode == 0:
+                break
+        else:
+            raise RuntimeError(f"Failed to join segments: {result.stderr}")
+        
+        if progress_callback:
+            progress_callback("Complete!", 100)
+        
+        return True
+    
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
@@ -8,19 +8,53 @@ import time
 import subprocess
 from pathlib import Path
 
-try:
-    from rich.console import Console
-    from rich.table import Table
-    from rich.panel import Panel
-    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeRemainingColumn
-    from rich.text import Text
-    from rich.align import Align
-    from rich import box
-    import questionary
-    from questionary import Style
-except ImportError:
+from ufps.core import process_video
+from ufps.utils import (
+    find_ffmpeg, get_video_info, get_video_files,
+    format_duration, get_fps_options
+)
+
+# rich and questionary are imported by _load_ui() when the UI is first
+# drawn, so importing this module doesn't pay for them
+console = None
+custom_style = None
+
+# Custom style for questionary
+STYLE_RULES = {
+    'qmark': 'fg:#673ab7 bold',
+    'question': 'bold',
+    'answer': 'fg:#f44336 bold',
+    'pointer': 'fg:#673ab7 bold',
+    'highlighted': 'fg:#673ab7 bold',
+    'selected': 'fg:#cc5454',
+    'separator': 'fg:#cc5454',
+    'instruction': 'fg:#abb2bf',
+    'text': '',
+    'disabled': 'fg:#858585 italic',
+}
+
+
+def _install_ui():
+    """Install the UI packages into the running interpreter"""
     print("Installing required packages...")
     subprocess.run([sys.executable, "-m", "pip", "install", "rich", "questionary"], check=True)
+
+
+def _load_ui():
+    """Import the UI packages and build the shared console and prompt style"""
+    global console, custom_style, questionary, box
+    global Console, Table, Panel, Progress, SpinnerColumn, TextColumn, BarColumn
+    global TimeRemainingColumn, Text, Align, Style
+    
+    if console is not None:
+        return
+    
+    try:
+        import rich
+        import questionary
+    except ImportError:
+        _install_ui()
+    
     from rich.console import Console
     from rich.table import Table
     from rich.panel import Panel
@@ -30,28 +64,11 @@ except ImportError:
     from rich import box
     import questionary
     from questionary import Style
-
-from ufps.core import process_video
-from ufps.utils import (
-    find_ffmpeg, get_video_info, get_video_files,
-    format_duration, get_fps_options
-)
-
-console = Console()
-
-# Custom style for questionary
-custom_style = Style([
-    ('qmark', 'fg:#673ab7 bold'),
-    ('question', 'bold'),
-    ('answer', 'fg:#f44336 bold'),
-    ('pointer', 'fg:#673ab7 bold'),
-    ('highlighted', 'fg:#673ab7 bold'),
-    ('selected', 'fg:#cc5454'),
-    ('separator', 'fg:#cc5454'),
-    ('instruction', 'fg:#abb2bf'),
-    ('text', ''),
-    ('disabled', 'fg:#858585 italic')
-])
+    
+    console = Console()
+    
+    # Compiled once and shared by every prompt
+    custom_style = Style.from_dict(STYLE_RULES)
 
 
 class InteractiveCLI:
@@ -156,6 +173,7 @@ class InteractiveCLI:
     
     def run(self):
         """Main CLI loop"""
+        _load_ui()
         self.display_banner()
         
         if not self.check_requirements():
@@ -170,15 +188,15 @@ class InteractiveCLI:
             sys.exit(1)
         
         # Select video
-        video_choices = []
-        for v in video_files:
-            size_mb = v.stat().st_size / 1024 / 1024
+        video_choices = {}
+        for v, size_bytes in video_files:
+            size_mb = size_bytes / 1024 / 1024
             display_name = v.name if len(v.name) <= 60 else v.name[:57] + "..."
-            video_choices.append(f"{display_name} ({size_mb:.1f} MB)")
+            video_choices[f"{display_name} ({size_mb:.1f} MB)"] = (v, size_bytes)
         
         selected_index = questionary.select(
             "Select a video file:",
-            choices=video_choices,
+            choices=list(video_choices),
             style=custom_style
         ).ask()
         
@@ -186,7 +204,7 @@ class InteractiveCLI:
             console.print("[yellow]Cancelled[/yellow]")
             sys.exit(0)
         
-        selected_video = video_files[video_choices.index(selected_index)]
+        selected_video, selected_size = video_choices[selected_index]
         
         console.print()
         console.print(f"[green]Selected:[/green] {selected_video.name}")
@@ -194,7 +212,7 @@ class InteractiveCLI:
         
         # Get video info
         with console.status("[bold green]Analyzing video..."):
-            info = get_video_info(selected_video, self.ffprobe_path)
+            info = get_video_info(selected_video, self.ffprobe_path, selected_size)
         
         self.display_video_info(selected_video, info)
         console.print()
@@ -210,7 +228,7 @@ class InteractiveCLI:
         console.print()
         
         # Select target FPS
-        fps_choices = []
+        fps_choices = {}
         for opt in fps_options:
             choice = f"{opt['actual']:.0f} FPS ({opt['scale']}× interpolation)"
             if opt['actual'] == 60:
@@ -219,11 +237,11 @@ class InteractiveCLI:
                 choice += " 🎮 Gaming"
             elif opt['actual'] == 240:
                 choice += " 🎬 Slow Motion"
-            fps_choices.append(choice)
+            fps_choices[choice] = opt
         
         selected_fps = questionary.select(
             "Choose target frame rate:",
-            choices=fps_choices,
+            choices=list(fps_choices),
             style=custom_style
         ).ask()
         
@@ -231,7 +249,7 @@ class InteractiveCLI:
             console.print("[yellow]Cancelled[/yellow]")
             sys.exit(0)
         
-        selected_option = fps_options[fps_choices.index(selected_fps)]
+        selected_option = fps_choices[selected_fps]
         
         # Quality selection
         quality_choice = questionary.select(
@@ -310,12 +328,28 @@ class InteractiveCLI:
             BarColumn(),
             TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
             TimeRemainingColumn(),
-            console=console
+            console=console,
+            # Redraw only when update_progress emits, not on a timer; the
+            # spinner and time remaining hold still between updates
+            auto_refresh=False
         ) as progress:
             task = progress.add_task("[cyan]Processing video...", total=100)
             
+            last_pct = [-1.0]
+            last_t = [0.0]
+            last_msg = [None]
+            
             def update_progress(msg, pct):
-                progress.update(task, description=f"[cyan]{msg}", completed=pct)
+                # Terminal writes are synchronous - coalesce bursts of ticks,
+                # but never drop a stage change
+                now = time.monotonic()
+                if (msg != last_msg[0] or pct - last_pct[0] >= 1.0
+                        or now - last_t[0] >= 0.1 or pct >= 100):
+                    last_pct[0] = pct
+                    last_t[0] = now
+                    last_msg[0] = msg
+                    progress.update(task, description=f"[cyan]{msg}", completed=pct)
+                    progress.refresh()
             
             try:
                 success = process_video(
@@ -2,14 +2,21 @@
 Utility functions for UFPS
 """
 
+import os
 import json
+import bisect
+import functools
 import subprocess
 import shutil
 from pathlib import Path
 import platform
 
+# Extensions listed by get_video_files, lowercase with the dot
+_VIDEO_EXTS = frozenset({'.mp4', '.avi', '.mov', '.mkv', '.webm', '.flv', '.wmv', '.m4v'})
+
+@functools.lru_cache(maxsize=1)
 def find_ffmpeg():
-    """Find ffmpeg and ffprobe executables"""
+    """Find ffmpeg and ffprobe executables (looked up once per process)"""
     # Check if in PATH
     ffmpeg_path = shutil.which('ffmpeg')
     ffprobe_path = shutil.which('ffprobe')
@@ -34,8 +41,8 @@ def find_ffmpeg():
     
     return None, None
 
-def get_video_info(video_path, ffprobe_path=None):
-    """Get detailed video information"""
+def get_video_info(video_path, ffprobe_path=None, file_size_bytes=None):
+    """Get detailed video information (pass file_size_bytes if already known)"""
     ffprobe = ffprobe_path or shutil.which('ffprobe')
     if not ffprobe:
         raise RuntimeError("ffprobe not found")
@@ -46,26 +53,25 @@ def get_video_info(video_path, ffprobe_path=None):
         ffprobe,
         '-v', 'quiet',
         '-print_format', 'json',
-        '-show_format',
-        '-show_streams',
+        # Only the fields read below, to keep ffprobe's output small
+        '-show_entries',
+        'stream=codec_type,codec_name,width,height,r_frame_rate,nb_frames'
+        ':format=duration,bit_rate,size',
         str(video_path)
     ]
     
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    # json.loads takes bytes, so skip decoding ffprobe's output to str first
+    result = subprocess.run(cmd, capture_output=True)
     
     if result.returncode != 0:
-        raise RuntimeError(f"Failed to get video info: {result.stderr}")
+        raise RuntimeError(f"Failed to get video info: {result.stderr.decode('utf-8', 'replace')}")
     
     data = json.loads(result.stdout)
     
-    # Find video stream
-    video_stream = None
-    audio_stream = None
-    for stream in data.get('streams', []):
-        if stream['codec_type'] == 'video' and not video_stream:
-            video_stream = stream
-        elif stream['codec_type'] == 'audio' and not audio_stream:
-            audio_stream = stream
+    # First video and audio streams
+    streams = data.get('streams', ())
+    video_stream = next((s for s in streams if s.get('codec_type') == 'video'), None)
+    audio_stream = next((s for s in streams if s.get('codec_type') == 'audio'), None)
     
     if not video_stream:
         raise RuntimeError("No video stream found")
@@ -82,7 +88,9 @@ def get_video_info(video_path, ffprobe_path=None):
     duration = float(data.get('format', {}).get('duration', 0))
     
     # File size
-    file_size = Path(video_path).stat().st_size / (1024 * 1024)  # MB
+    if file_size_bytes is None:
+        file_size_bytes = video_path.stat().st_size
+    file_size = file_size_bytes / (1024 * 1024)  # MB
     
     return {
         'fps': fps,
@@ -98,15 +106,16 @@ def get_video_info(video_path, ffprobe_path=None):
     }
 
 def get_video_files(directory="."):
-    """Get all video files in the directory"""
-    video_extensions = {'.mp4', '.avi', '.mov', '.mkv', '.webm', '.flv', '.wmv', '.m4v'}
+    """Get all video files in the directory as (path, size in bytes) pairs"""
     video_files = []
     
-    for file in Path(directory).iterdir():
-        if file.suffix.lower() in video_extensions and file.is_file():
-            video_files.append(file)
+    # DirEntry.is_file() uses the type readdir already returned - no stat
+    with os.scandir(directory) as it:
+        for entry in it:
+            if os.path.splitext(entry.name)[1].lower() in _VIDEO_EXTS and entry.is_file():
+                video_files.append((Path(entry.path), entry.stat().st_size))
     
-    return sorted(video_files, key=lambda x: x.name.lower())
+    return sorted(video_files, key=lambda x: x[0].name.lower())
 
 def format_duration(seconds):
     """Format duration nicely"""
@@ -121,51 +130,30 @@ def format_duration(seconds):
         minutes = int((seconds % 3600) // 60)
         return f"{hours}h {minutes}m"
 
+# Frame rates offered as upgrade targets, ascending
+_STANDARD_FPS = (24, 25, 30, 48, 50, 60, 90, 96, 100, 120, 144, 180, 240)
+
 def get_fps_options(current_fps):
     """Get valid FPS upgrade options based on current FPS"""
-    standard_fps = [24, 25, 30, 48, 50, 60, 90, 96, 100, 120, 144, 180, 240]
-    
     options = []
-    for target in standard_fps:
-        if target > current_fps:
-            scale_needed = target / current_fps
-            
-            # Check if achievable with RIFE (2x, 4x, 8x)
-            if scale_needed <= 2:
-                actual_fps = current_fps * 2
-                scale = 2
-            elif scale_needed <= 4:
-                actual_fps = current_fps * 4
-                scale = 4
-            elif scale_needed <= 8:
-                actual_fps = current_fps * 8
-                scale = 8
-            else:
-                continue
-            
-            # Add option
-            if abs(actual_fps - target) < 1:
-                options.append({
-                    'target': target,
-                    'actual': actual_fps,
-                    'scale': scale,
-                    'exact': True
-                })
-            elif actual_fps <= 240:
-                options.append({
-                    'target': actual_fps,
-                    'actual': actual_fps,
-                    'scale': scale,
-                    'exact': False
-                })
-    
-    # Remove duplicates
-    seen = set()
-    unique_options = []
-    for opt in options:
-        key = (opt['actual'], opt['scale'])
-        if key not in seen:
-            seen.add(key)
-            unique_options.append(opt)
-    
-    return sorted(unique_options, key=lambda x: x['actual'])
\ No newline at end of file
+    # RIFE only multiplies by 2, 4 or 8, so there are at most three options
+    for scale in (2, 4, 8):
+        actual_fps = current_fps * scale
+        
+        # Standard rates this scale is the smallest to reach: (actual/2, actual]
+        first = bisect.bisect_right(_STANDARD_FPS, actual_fps / 2)
+        last = bisect.bisect_right(_STANDARD_FPS, actual_fps)
+        target = next((t for t in _STANDARD_FPS[first:last]
+                       if actual_fps <= 240 or abs(actual_fps - t) < 1), None)
+        if target is None:
+            continue
+        
+        exact = abs(actual_fps - target) < 1
+        options.append({
+            'target': target if exact else actual_fps,
+            'actual': actual_fps,
+            'scale': scale,
+            'exact': exact
+        })
+    
+    return options
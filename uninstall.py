@@ -9,6 +9,7 @@ import sys
 import shutil
 from pathlib import Path
 import json
+from concurrent.futures import ThreadPoolExecutor, wait
 
 # Installation paths
 INSTALL_DIR = Path.home() / ".ufps"
@@ -36,23 +37,48 @@ class ColorPrint:
     def error(cls, msg):
         print(f"{cls.FAIL}✗{cls.ENDC}  {msg}")
 
+def _iter_files(path):
+    """Yield the size of every regular file below path, without following links"""
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_symlink():
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_files(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                yield entry.stat(follow_symlinks=False).st_size
+
+def _install_size():
+    """Total bytes under INSTALL_DIR, or None if it can't be walked"""
+    try:
+        return sum(_iter_files(INSTALL_DIR))
+    except OSError:
+        return None
+
 def confirm_uninstall():
-    """Ask for confirmation"""
+    """Ask for confirmation; returns (confirmed, future for the install size)"""
     print("""
 ╔═══════════════════════════════════════╗
 ║         UFPS UNINSTALLER v1.0         ║
 ╚═══════════════════════════════════════╝
     """)
     
+    size_future = None
     if INSTALL_DIR.exists():
-        # Calculate size
-        total_size = sum(f.stat().st_size for f in INSTALL_DIR.rglob('*') if f.is_file())
-        size_mb = total_size / 1024 / 1024
+        # Walk the tree in the background so the prompt isn't held up by it
+        executor = ThreadPoolExecutor(max_workers=1)
+        size_future = executor.submit(_install_size)
+        executor.shutdown(wait=False)
         
         print(f"This will remove:")
         print(f"  • UFPS installation directory: {INSTALL_DIR}")
         print(f"  • Executable wrapper: {WRAPPER_PATH}")
-        print(f"  • Total space to be freed: {size_mb:.1f} MB")
+        # Small trees finish almost at once; don't make the user wait on big ones
+        wait([size_future], timeout=0.2)
+        if size_future.done() and size_future.result() is not None:
+            print(f"  • Total space to be freed: {size_future.result() / 1024 / 1024:.1f} MB")
+        else:
+            print(f"  • Total space to be freed: (size still calculating)")
         print()
     else:
         ColorPrint.warning("UFPS installation not found at expected location")
@@ -60,7 +86,7 @@ def confirm_uninstall():
         print()
     
     response = input("Continue with uninstallation? [y/N]: ").strip().lower()
-    return response == 'y'
+    return response == 'y', size_future
 
 def remove_installation():
     """Remove all UFPS files"""
@@ -95,10 +121,14 @@ def remove_installation():
 
 def main():
     """Main uninstall process"""
-    if not confirm_uninstall():
+    confirmed, size_future = confirm_uninstall()
+    if not confirmed:
         print("Uninstallation cancelled")
         sys.exit(0)
     
+    # Finish sizing before rmtree starts deleting what the walk is reading
+    total_size = size_future.result() if size_future else None
+    
     print("\nUninstalling UFPS...")
     print("-" * 40)
     
@@ -122,6 +152,8 @@ def main():
         print("You may need to manually remove remaining files")
     else:
         ColorPrint.success("UFPS has been completely uninstalled")
+        if total_size is not None:
+            print(f"Freed {total_size / 1024 / 1024:.1f} MB")
     
     # PATH reminder
     print(f"""